@@ -2,8 +2,10 @@ use std::str::FromStr;
 
 use bdk_wallet::{
     bitcoin::{
-        consensus::encode::serialize, hashes::Hash, taproot::LeafVersion, Address, FeeRate,
-        TapNodeHash, Transaction, XOnlyPublicKey,
+        consensus::encode::{serialize, serialize_hex},
+        hashes::Hash,
+        taproot::LeafVersion,
+        Address, FeeRate, TapNodeHash, Transaction, XOnlyPublicKey,
     },
     miniscript::{miniscript::Tap, Miniscript},
     template::DescriptorTemplateOut,
@@ -52,6 +54,41 @@ pub(crate) fn deposit_request_transaction(
     Ok(signed_tx)
 }
 
+/// Generates a deposit request transaction (DRT), like [`deposit_request_transaction`],
+/// but returns it hex-encoded.
+///
+/// This is what the functional tests broadcast, and it spares converting the `Vec<u8>`
+/// into a Python list of ints and hex-encoding it again on the Python side.
+///
+/// # Arguments
+///
+/// - `el_address`: Execution layer address of the account that will receive the funds.
+/// - `musig_bridge_pk`: MuSig bridge X-only public key.
+/// - `bitcoind_url`: URL of the `bitcoind` instance.
+/// - `bitcoind_user`: Username for the `bitcoind` instance.
+/// - `bitcoind_password`: Password for the `bitcoind` instance.
+///
+/// # Returns
+///
+/// A signed (with the `private_key`) and hex-encoded serialized transaction.
+#[pyfunction]
+pub(crate) fn deposit_request_transaction_hex(
+    el_address: String,
+    musig_bridge_pk: String,
+    bitcoind_url: String,
+    bitcoind_user: String,
+    bitcoind_password: String,
+) -> PyResult<String> {
+    let signed_tx = deposit_request_transaction_inner(
+        el_address.as_str(),
+        musig_bridge_pk.as_str(),
+        bitcoind_url.as_str(),
+        bitcoind_user.as_str(),
+        bitcoind_password.as_str(),
+    )?;
+    Ok(serialize_hex(&signed_tx))
+}
+
 /// Generates a deposit request transaction (DRT).
 ///
 /// # Arguments
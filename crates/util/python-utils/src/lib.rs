@@ -9,8 +9,8 @@ mod taproot;
 mod utils;
 
 use drt::{
-    deposit_request_transaction, get_balance, get_balance_recovery, get_recovery_address,
-    take_back_transaction,
+    deposit_request_transaction, deposit_request_transaction_hex, get_balance,
+    get_balance_recovery, get_recovery_address, take_back_transaction,
 };
 use schnorr::{sign_schnorr_sig, verify_schnorr_sig};
 use taproot::{
@@ -28,6 +28,7 @@ use utils::{
 #[pymodule]
 fn strata_utils(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(deposit_request_transaction, m)?)?;
+    m.add_function(wrap_pyfunction!(deposit_request_transaction_hex, m)?)?;
     m.add_function(wrap_pyfunction!(get_address, m)?)?;
     m.add_function(wrap_pyfunction!(get_change_address, m)?)?;
     m.add_function(wrap_pyfunction!(musig_aggregate_pks, m)?)?;
@@ -1,50 +1,95 @@
-from typing import Annotated, Literal, Union
+import functools
+import json
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Literal, Union
 
-from pydantic import BaseModel, StringConstraints
+# A string that optionally starts with 0x, followed by exactly 64 hex characters.
+# NOTE: it's not validated, the params are generated by our own datatool.
+StrBuf32 = str
 
-# A string that optionally starts with 0x, followed by exactly 64 hex characters
-StrBuf32 = Annotated[str, StringConstraints(pattern=r"^(0x)?[0-9A-Fa-f]{64}$")]
+_wallet_pk = attrgetter("wallet_pk")
 
 
-class CredRule(BaseModel):
+@functools.cache
+def _field_names(cls) -> frozenset[str]:
+    return frozenset(f.name for f in fields(cls))
+
+
+def _known_fields(cls, data: dict) -> dict:
+    """Picks the entries of `data` that are fields of the dataclass `cls`, ignores the rest."""
+    names = _field_names(cls)
+    return {k: v for k, v in data.items() if k in names}
+
+
+@dataclass(frozen=True, slots=True)
+class CredRule:
     schnorr_key: StrBuf32
 
 
-class OperatorConfigItem(BaseModel):
+@dataclass(frozen=True, slots=True)
+class OperatorConfigItem:
     signing_pk: StrBuf32
     wallet_pk: StrBuf32
 
 
-class OperatorConfig(BaseModel):
-    static: list[OperatorConfigItem]
+@dataclass(frozen=True, slots=True)
+class OperatorConfig:
+    static: tuple[OperatorConfigItem, ...]
 
     def get_operators_pubkeys(self) -> list[str]:
-        return [operator.wallet_pk for operator in self.static]
+        return list(map(_wallet_pk, self.static))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "OperatorConfig":
+        return cls(
+            static=tuple(
+                OperatorConfigItem(**_known_fields(OperatorConfigItem, op)) for op in data["static"]
+            )
+        )
 
 
-class Sp1RollupVk(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Sp1RollupVk:
     sp1: StrBuf32
 
 
-class Risc0RollupVk(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Risc0RollupVk:
     risc0: StrBuf32
 
 
-class NativeRollupVk(BaseModel):
+@dataclass(frozen=True, slots=True)
+class NativeRollupVk:
     native: StrBuf32
 
 
 RollupVk = Union[Sp1RollupVk, Risc0RollupVk, NativeRollupVk]
 
 
-class ProofPublishModeTimeout(BaseModel):
+def _rollup_vk_from_dict(data: dict) -> RollupVk:
+    for vk_cls in (Sp1RollupVk, Risc0RollupVk, NativeRollupVk):
+        if fields(vk_cls)[0].name in data:
+            return vk_cls(**data)
+    raise ValueError(f"unknown rollup vk {data}")
+
+
+@dataclass(frozen=True, slots=True)
+class ProofPublishModeTimeout:
     timeout: int
 
 
 ProofPublishMode = Union[Literal["strict"], ProofPublishModeTimeout]
 
 
-class RollupConfig(BaseModel):
+def _proof_publish_mode_from_json(data: str | dict) -> ProofPublishMode:
+    if data == "strict":
+        return data
+    return ProofPublishModeTimeout(**data)
+
+
+@dataclass(frozen=True, slots=True)
+class RollupConfig:
     """
     A rollup params config data-class.
     Can be used to work with config values conveniently.
@@ -77,3 +122,19 @@ class RollupConfig(BaseModel):
     # + 5.5 sats/vB (200 vbytes) according to `MIN_RELAY_FEE`
     # in `bridge-tx-builder/src/constants.rs`
     withdraw_extra_fee: int = int(330 + 5.5 * 200)
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "RollupConfig":
+        """
+        Builds the config from the params JSON generated by the datatool.
+        The unknown fields are ignored.
+
+        NOTE: no validation is done, the datatool output is trusted.
+        Don't use it for params coming from anywhere else.
+        """
+        data = _known_fields(cls, json.loads(raw))
+        data["cred_rule"] = CredRule(**data["cred_rule"])
+        data["operator_config"] = OperatorConfig.from_dict(data["operator_config"])
+        data["rollup_vk"] = _rollup_vk_from_dict(data["rollup_vk"])
+        data["proof_publish_mode"] = _proof_publish_mode_from_json(data["proof_publish_mode"])
+        return cls(**data)
@@ -1,9 +1,11 @@
 import copy
+import functools
 import json
 import time
 from typing import Optional
 
 import flexitest
+from bitcoinlib.services.bitcoind import BitcoindClient
 from strata_utils import (
     get_address,
     get_recovery_address,
@@ -11,6 +13,7 @@ from strata_utils import (
 
 from envs.rollup_params_cfg import RollupConfig
 from factory.config import BitcoindConfig, RethELConfig
+from factory.seqrpc import JsonrpcClient
 from load.cfg import LoadConfig, LoadConfigBuilder
 from utils import *
 from utils.constants import *
@@ -22,6 +25,7 @@ class StrataTester(flexitest.Test):
     """
 
     def premain(self, ctx: flexitest.RunContext):
+        self._ctx = ctx
         logger = setup_test_logger(ctx.datadir_root, ctx.name)
         self.debug = logger.debug
         self.info = logger.info
@@ -29,6 +33,20 @@ class StrataTester(flexitest.Test):
         self.error = logger.error
         self.critical = logger.critical
 
+    # RPC clients of the basic services, created on first use and shared by the whole test.
+
+    @functools.cached_property
+    def btcrpc(self) -> BitcoindClient:
+        return self._ctx.get_service("bitcoin").create_rpc()
+
+    @functools.cached_property
+    def seqrpc(self) -> JsonrpcClient:
+        return self._ctx.get_service("sequencer").create_rpc()
+
+    @functools.cached_property
+    def rethrpc(self) -> JsonrpcClient:
+        return self._ctx.get_service("reth").create_rpc()
+
 
 class StrataTestRuntime(flexitest.TestRuntime):
     """
@@ -146,7 +164,7 @@ class BasicEnvConfig(flexitest.EnvConfig):
         params_gen_data = generate_simple_params(initdir, settings, self.n_operators)
         params = params_gen_data["params"]
         # Instantiaze the generated rollup config so it's convenient to work with.
-        rollup_cfg = RollupConfig.model_validate_json(params)
+        rollup_cfg = RollupConfig.from_json(params)
 
         # Construct the bridge pubkey from the config.
         # Technically, we could use utils::get_bridge_pubkey, but this makes sequencer
@@ -281,7 +299,7 @@ class HubNetworkEnvConfig(flexitest.EnvConfig):
         params_gen_data = generate_simple_params(initdir, settings, self.n_operators)
         params = params_gen_data["params"]
         # Instantiaze the generated rollup config so it's convenient to work with.
-        rollup_cfg = RollupConfig.model_validate_json(params)
+        rollup_cfg = RollupConfig.from_json(params)
 
         # Construct the bridge pubkey from the config.
         # Technically, we could use utils::get_bridge_pubkey, but this makes sequencer
@@ -410,7 +428,7 @@ class DualSequencerMixedPolicyEnvConfig(flexitest.EnvConfig):
         # 1. Prepare rollup parameters
         init_dir = ctx.make_service_dir("_init")
         params = self._generate_params(init_dir)
-        rollup_cfg_strict = RollupConfig.model_validate_json(params["strict"])
+        rollup_cfg_strict = RollupConfig.from_json(params["strict"])
         bridge_pk = get_bridge_pubkey_from_cfg(rollup_cfg_strict)
 
         # 2. Shared JWT secret for Reth
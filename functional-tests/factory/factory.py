@@ -304,14 +304,22 @@ class RethFactory(flexitest.Factory):
         svc = flexitest.service.ProcService(props, cmd, stdout=logfile)
         svc.start()
 
+        # Shared by all the Web3 instances of the service, so they reuse its keep-alive
+        # connection pool. Each `create_web3` call still gets its own instance, as the
+        # tests customize them (default account, middlewares).
+        provider = web3.Web3.HTTPProvider(
+            f"http://localhost:{ethrpc_http_port}",
+            session=seqrpc.new_http_session(),
+            # The chain id never changes, don't ask for it again for every signed tx.
+            cache_allowed_requests=True,
+            cacheable_requests={"eth_chainId"},
+        )
+
         def _create_web3():
-            http_ethrpc_url = f"http://localhost:{ethrpc_http_port}"
-            w3 = web3.Web3(web3.Web3.HTTPProvider(http_ethrpc_url))
+            w3 = web3.Web3(provider)
             # address, pk hardcoded in test genesis config
-            w3.address = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
-            account = w3.eth.account.from_key(
-                "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
-            )
+            w3.address = DEV_ACCOUNT_ADDRESS
+            account = w3.eth.account.from_key(DEV_ACCOUNT_PRIVATE_KEY)
             w3.middleware_onion.add(web3.middleware.SignAndSendRawMiddlewareBuilder.build(account))
             return w3
 
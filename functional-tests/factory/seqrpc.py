@@ -1,10 +1,37 @@
 import json
-from typing import Optional
+import threading
+from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from websockets.exceptions import ConnectionClosed
 from websockets.sync.client import connect as wsconnect
 
 
+def _json_dumps(obj) -> bytes:
+    return json.dumps(obj).encode()
+
+
+# Sized to comfortably cover the load generator users plus the test thread.
+HTTP_POOL_SIZE = 64
+
+
+def new_http_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """
+    Creates a `requests` session with a keep-alive connection pool, so that
+    consecutive calls to the same host don't pay for a new TCP connection each.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by all the HTTP JSON-RPC clients in the process.
+_http_session = new_http_session()
+
+
 class RpcError(Exception):
     def __init__(self, code: int, msg: str, data=None):
         self.code = code
@@ -15,15 +42,23 @@ class RpcError(Exception):
         return f"RpcError: code {self.code} ({self.msg})"
 
 
-def _make_request(method: str, req_id: int, params) -> str:
+def _request_obj(method: str, req_id: int, params) -> dict:
+    """Assembles a request object from parts."""
+    return {"jsonrpc": "2.0", "method": method, "id": req_id, "params": params}
+
+
+def _make_request(method: str, req_id: int, params) -> bytes:
     """Assembles a request body from parts."""
-    req = {"jsonrpc": "2.0", "method": method, "id": req_id, "params": params}
-    return json.dumps(req)
+    return _json_dumps(_request_obj(method, req_id, params))
 
 
-def _handle_response(resp_str: str):
+def _handle_response(resp_str: bytes):
     """Takes a response body and extracts the result or raises the error."""
-    resp = json.loads(resp_str)
+    return _extract_result(json.loads(resp_str))
+
+
+def _extract_result(resp: dict):
+    """Takes a decoded response object and extracts the result or raises the error."""
     if "error" in resp:
         e = resp["error"]
         d = None
@@ -33,19 +68,21 @@ def _handle_response(resp_str: str):
     return resp["result"]
 
 
-def _send_single_ws_request(url: str, request: str, max_size: Optional[int] = None) -> str:
+# The requests and responses are kept as UTF-8 encoded bytes all the way, so the JSON
+# is neither decoded to str before being sent nor after being received.
+def _send_single_ws_request(url: str, request: bytes, max_size: Optional[int] = None) -> bytes:
     with wsconnect(url, max_size=max_size) as w:
-        w.send(request)
-        return w.recv()
+        w.send(request, text=True)
+        return w.recv(decode=False)
 
 
-def _send_http_request(url: str, request: str) -> str:
+def _send_http_request(url: str, request: bytes) -> bytes:
     h = {"Content-Type": "application/json"}
-    res = requests.post(url, headers=h, data=request)
-    return res.text
+    res = _http_session.post(url, headers=h, data=request)
+    return res.content
 
 
-def _dispatch_request(url: str, request: str, max_size: Optional[int] = None) -> str:
+def _dispatch_request(url: str, request: bytes, max_size: Optional[int] = None) -> bytes:
     if url.startswith("http"):
         return _send_http_request(url, request)
     elif url.startswith("ws"):
@@ -54,32 +91,132 @@ def _dispatch_request(url: str, request: str, max_size: Optional[int] = None) ->
         raise ValueError(f"unsupported protocol in url '{url}'")
 
 
+class Subscription:
+    """
+    An `eth_subscribe` subscription on its own websocket connection. The node pushes
+    the notifications to us, so they don't have to be polled for.
+    """
+
+    def __init__(self, url: str, kind: str, params: list):
+        self._ws = wsconnect(url, max_size=None)
+        self._ws.send(_make_request("eth_subscribe", 0, [kind, *params]), text=True)
+        self.id = _handle_response(self._ws.recv(decode=False))
+
+    def next(self, timeout: Optional[float] = None) -> Any:
+        """
+        Returns the result of the next notification.
+        Raises `TimeoutError` if none arrives within `timeout` seconds.
+        """
+        msg = json.loads(self._ws.recv(timeout=timeout, decode=False))
+        return msg["params"]["result"]
+
+    def close(self):
+        self._ws.close()
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 class JsonrpcClient:
     def __init__(self, url: str):
         self.url = url
         self.req_idx = 0
         # Hook that lets us add a check that runs before every call.
         self._pre_call_hook = None
+        # Persistent websocket connection, opened lazily on the first call.
+        self._ws = None
+        self._ws_lock = threading.Lock()
+
+    def _ws_connection(self):
+        if self._ws is None:
+            self._ws = wsconnect(self.url, max_size=None)
+        return self._ws
+
+    def _send_ws_request(self, request: bytes) -> bytes:
+        """
+        Sends the request over the persistent websocket connection, reopening
+        it if the previous one was closed (e.g. the service was restarted).
+        """
+        with self._ws_lock:
+            try:
+                ws = self._ws_connection()
+                ws.send(request, text=True)
+            except ConnectionClosed:
+                self._ws = None
+                ws = self._ws_connection()
+                ws.send(request, text=True)
+
+            try:
+                return ws.recv(decode=False)
+            except ConnectionClosed:
+                # The request might have been processed, so don't retry it.
+                self._ws = None
+                raise
+
+    def close(self):
+        """Closes the persistent websocket connection, if any."""
+        with self._ws_lock:
+            if self._ws is not None:
+                self._ws.close()
+                self._ws = None
 
     def _do_pre_call_check(self, m: str):
-        """Calls the pre-call hook if set."""
-        if self._pre_call_hook is not None:
-            h = self._pre_call_hook
-            r = h(m)
-            if type(r) is bool:
-                if not r:
-                    raise RuntimeError(f"failed precheck on call to '{m}'")
+        """Calls the pre-call hook if set, fails the call if the hook returns False."""
+        h = self._pre_call_hook
+        if h is not None and h(m) is False:
+            raise RuntimeError(f"failed precheck on call to '{m}'")
+
+    def _send(self, req: bytes, max_size: Optional[int] = None) -> bytes:
+        if self.url.startswith("ws") and max_size is None:
+            return self._send_ws_request(req)
+        return _dispatch_request(self.url, req, max_size=max_size)
 
     def _call(self, method: str, args, **kwargs):
         max_size = kwargs.get("max_size")
         self._do_pre_call_check(method)
         req = _make_request(method, self.req_idx, args)
         self.req_idx += 1
-        resp = _dispatch_request(self.url, req, max_size=max_size)
+        resp = self._send(req, max_size=max_size)
         return _handle_response(resp)
 
+    def call_batch(self, calls: list[tuple[str, list]]) -> list:
+        """
+        Sends the `(method, params)` calls as a single JSON-RPC 2.0 batch request,
+        so they cost one round trip. Returns the results in the order of `calls`,
+        raises the error of the first failed call if any.
+        """
+        self._do_pre_call_check(", ".join(m for m, _ in calls))
+        first_id = self.req_idx
+        reqs = [_request_obj(m, first_id + i, list(params)) for i, (m, params) in enumerate(calls)]
+        self.req_idx += len(calls)
+        decoded = json.loads(self._send(_json_dumps(reqs)))
+        if isinstance(decoded, dict):
+            # The server rejected the batch as a whole (e.g. parse error, batches not
+            # supported) and answered with a single response object.
+            _extract_result(decoded)
+            raise RpcError(-32603, f"unexpected single response to a batch request: {decoded}")
+        resps = {r["id"]: r for r in decoded}
+        return [_extract_result(resps[first_id + i]) for i in range(len(calls))]
+
+    def subscribe(self, kind: str, *params) -> Subscription:
+        """
+        Opens an `eth_subscribe` subscription of `kind` (e.g. `"newHeads"`) on a
+        dedicated connection. Only available on websocket endpoints.
+        """
+        if not self.url.startswith("ws"):
+            raise ValueError(f"subscriptions need a websocket url, got '{self.url}'")
+        self._do_pre_call_check("eth_subscribe")
+        return Subscription(self.url, kind, list(params))
+
     def __getattr__(self, name: str):
         def __call(*args, **kwargs):
             return self._call(name, args, **kwargs)
 
+        # Cache the method on the instance, so the next lookups (e.g. in the
+        # polling loops) are plain attribute reads and don't end up here.
+        if not name.startswith("__"):
+            self.__dict__[name] = __call
         return __call
@@ -1,3 +1,4 @@
+import gevent
 from locust import task
 
 from utils.transaction import EthTransactions, TransactionType, TransferTransaction
@@ -84,9 +85,18 @@ class BasicRethTxJob(BaseRethLoadJob):
         target_address = self.tx.w3.eth.account.create().address
 
         # Couple of transfers with different tx types.
-        self.transfer.transfer(target_address, 0.1, TransactionType.LEGACY)
-        self.transfer.transfer(target_address, 0.1, TransactionType.EIP2930)
-        self.transfer.transfer(target_address, 0.1, TransactionType.EIP1559)
+        # Those are independent (nonces are reserved under the account lock),
+        # so send them concurrently rather than paying three RPC round trips in a row.
+        gevent.joinall(
+            [
+                gevent.spawn(self.transfer.transfer, target_address, 0.1, tx_type)
+                for tx_type in (
+                    TransactionType.LEGACY,
+                    TransactionType.EIP2930,
+                    TransactionType.EIP1559,
+                )
+            ]
+        )
 
         # Increment Counter.
         self.tx.call_contract("Counter", "increment")
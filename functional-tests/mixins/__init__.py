@@ -7,14 +7,11 @@ from envs import testenv
 class BaseMixin(testenv.StrataTester):
     def premain(self, ctx: flexitest.RunContext):
         super().premain(ctx)
-        self._ctx = ctx
 
         self.btc = ctx.get_service("bitcoin")
         self.seq = ctx.get_service("sequencer")
         self.seq_signer = ctx.get_service("sequencer_signer")
         self.reth = ctx.get_service("reth")
 
-        self.seqrpc = self.seq.create_rpc()
-        self.btcrpc = self.btc.create_rpc()
-        self.rethrpc = self.reth.create_rpc()
+        # seqrpc, btcrpc and rethrpc are shared via StrataTester.
         self.web3: Web3 = self.reth.create_web3()
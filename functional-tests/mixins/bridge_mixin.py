@@ -1,22 +1,21 @@
-import time
+import functools
 
 import flexitest
 from strata_utils import (
-    deposit_request_transaction,
+    deposit_request_transaction_hex,
     is_valid_bosd,
 )
-from web3 import middleware
+from web3 import Web3, middleware
 
 from envs.rollup_params_cfg import RollupConfig
 from utils import *
-from utils.constants import PRECOMPILE_BRIDGEOUT_ADDRESS
+from utils.constants import BRIDGE_TEST_ETH_PRIVATE_KEY, PRECOMPILE_BRIDGEOUT_ADDRESS
 
 from . import BaseMixin
 
 # Local constants
-# Ethereum Private Key
-# NOTE: don't use this private key in production
-ETH_PRIVATE_KEY = "0x0000000000000000000000000000000000000000000000000000000000000001"
+# Checksummed once, so web3 doesn't have to normalize it on every withdrawal.
+BRIDGEOUT_ADDRESS = Web3.to_checksum_address(PRECOMPILE_BRIDGEOUT_ADDRESS)
 
 
 class BridgeMixin(BaseMixin):
@@ -28,7 +27,7 @@ class BridgeMixin(BaseMixin):
     def premain(self, ctx: flexitest.RunContext):
         super().premain(ctx)
 
-        self.eth_account = self.web3.eth.account.from_key(ETH_PRIVATE_KEY)
+        self.eth_account = self.web3.eth.account.from_key(BRIDGE_TEST_ETH_PRIVATE_KEY)
 
         # Inject signing middleware
         self.web3.middleware_onion.inject(
@@ -36,33 +35,92 @@ class BridgeMixin(BaseMixin):
             layer=0,
         )
 
+        # Gas estimates of the withdrawals, keyed by (from, value, destination).
+        self._withdraw_gas_estimates: dict[tuple[str, int, str], int] = {}
+
+        # The rollup params don't change during the test.
+        self.rollup_cfg: RollupConfig = ctx.env.rollup_cfg()
+        # D BTC
+        self._deposit_amount_wei = self.rollup_cfg.deposit_amount * SATS_TO_WEI
+
+        # Needed to build every DRT, resolved once.
+        self._btc_user = self.btc.get_prop("rpc_user")
+        self._btc_password = self.btc.get_prop("rpc_password")
+        self._seq_addr = self.seq.get_prop("address")
+
+    @functools.cached_property
+    def bridge_pk(self) -> str:
+        """
+        The bridge pubkey, as reported by the sequencer. It's fixed for the whole test.
+        """
+        return get_bridge_pubkey(self.seqrpc)
+
     def deposit(self, ctx: flexitest.RunContext, el_address, bridge_pk) -> str:
         """
         Make DRT deposit to the EL address. Wait until the deposit is reflected on L2.
 
         Returns the transaction id of the DRT on the bitcoin regtest.
         """
-        cfg: RollupConfig = ctx.env.rollup_cfg()
-        # D BTC
-        deposit_amount = cfg.deposit_amount
+        return self.deposit_batch(ctx, el_address, bridge_pk, 1)[0]
 
-        # bridge pubkey
-        self.info(f"Bridge pubkey: {bridge_pk}")
+    def deposit_batch(self, ctx: flexitest.RunContext, el_address, bridge_pk, n: int) -> list[str]:
+        """
+        Make `n` DRT deposits to the EL address, matured together.
+        Wait until all the deposits are reflected on L2.
 
-        # check balance before deposit
-        initial_balance = int(self.rethrpc.eth_getBalance(el_address), 16)
-        self.info(f"Strata Balance right before deposit calls: {initial_balance}")
+        Returns the transaction ids of the DRTs on the bitcoin regtest.
+        """
+        return self.deposit_many(ctx, [el_address] * n, bridge_pk)
+
+    def deposit_many(
+        self, ctx: flexitest.RunContext, el_addresses: list[str], bridge_pk
+    ) -> list[str]:
+        """
+        Make a DRT deposit to each of the EL addresses, matured together.
+        An address that is listed several times gets several deposits.
+        Wait until all the deposits are reflected on L2.
 
-        tx_id = self.make_drt(el_address, bridge_pk)
+        Returns the transaction ids of the DRTs on the bitcoin regtest, in the order
+        of `el_addresses`.
+        """
+        # bridge pubkey
+        self.info(f"Bridge pubkey: {bridge_pk}")
 
-        # Wait until the deposit is seen on L2
-        expected_balance = initial_balance + deposit_amount * SATS_TO_WEI
+        # check balances before deposit
+        addresses = list(dict.fromkeys(el_addresses))
+        initial_balances = self.__get_balances(addresses)
+        for el_address, balance in zip(addresses, initial_balances, strict=True):
+            self.info(f"Strata Balance of {el_address} right before deposit calls: {balance}")
+
+        tx_ids = []
+        for i, el_address in enumerate(el_addresses):
+            if i > 0:
+                # The DRT wallet is synced from the confirmed blocks only, confirm the
+                # previous DRT so the next one doesn't spend the same coins.
+                self.btcrpc.proxy.generatetoaddress(1, self._seq_addr)
+            tx_ids.append(self.send_drt(el_address, bridge_pk))
+        self.mature_drts()
+
+        # Wait until the deposits are seen on L2
+        expected_balances = [
+            balance + el_addresses.count(el_address) * self._deposit_amount_wei
+            for el_address, balance in zip(addresses, initial_balances, strict=True)
+        ]
         wait_until(
-            lambda: int(self.rethrpc.eth_getBalance(el_address), 16) == expected_balance,
+            lambda: self.__get_balances(addresses) == expected_balances,
             error_with="Strata balance after deposit is not as expected",
         )
 
-        return tx_id
+        return tx_ids
+
+    def __get_balances(self, el_addresses: list[str]) -> list[int]:
+        """
+        Fetches the latest balances of the EL addresses in a single batch request.
+        """
+        balances = self.rethrpc.call_batch(
+            [("eth_getBalance", [el_address, "latest"]) for el_address in el_addresses]
+        )
+        return [int(balance, 16) for balance in balances]
 
     def withdraw(
         self,
@@ -76,9 +134,7 @@ class BridgeMixin(BaseMixin):
 
         NOTE: The withdrawal destination is a Bitcoin Output Script Descriptor (BOSD).
         """
-        cfg: RollupConfig = ctx.env.rollup_cfg()
-        # D BTC
-        deposit_amount = cfg.deposit_amount
+        deposit_amount_wei = self._deposit_amount_wei
         # Build the BOSD descriptor from the withdraw address
         # Assert is a valid BOSD
         assert is_valid_bosd(destination), "Invalid BOSD"
@@ -86,18 +142,18 @@ class BridgeMixin(BaseMixin):
 
         # Estimate gas
         estimated_withdraw_gas = self.__estimate_withdraw_gas(
-            deposit_amount, el_address, destination
+            deposit_amount_wei, el_address, destination
         )
         self.info(f"Estimated withdraw gas: {estimated_withdraw_gas}")
 
         l2_tx_hash = self.__make_withdraw(
-            deposit_amount, el_address, destination, estimated_withdraw_gas
+            deposit_amount_wei, el_address, destination, estimated_withdraw_gas
         ).hex()
         self.info(f"Sent withdrawal transaction with hash: {l2_tx_hash}")
 
         # Wait for transaction receipt
         tx_receipt = wait_until_with_value(
-            lambda: self.web3.eth.get_transaction_receipt(l2_tx_hash),
+            functools.partial(self.web3.eth.get_transaction_receipt, l2_tx_hash),
             predicate=lambda v: v is not None,
         )
         self.info(f"Transaction receipt: {tx_receipt}")
@@ -106,8 +162,8 @@ class BridgeMixin(BaseMixin):
         self.info(f"Total gas used: {total_gas_used}")
 
         # Ensure the leftover in the EL address is what's expected (deposit minus gas)
-        balance_post_withdraw = int(self.rethrpc.eth_getBalance(el_address), 16)
-        difference = deposit_amount * SATS_TO_WEI - total_gas_used
+        balance_post_withdraw = eth_balance_wei(self.rethrpc, el_address)
+        difference = deposit_amount_wei - total_gas_used
         self.info(f"Strata Balance after withdrawal: {balance_post_withdraw}")
         self.info(f"Strata Balance difference: {difference}")
         assert difference == balance_post_withdraw, "balance difference is not expected"
@@ -116,7 +172,7 @@ class BridgeMixin(BaseMixin):
 
     def __make_withdraw(
         self,
-        deposit_amount,
+        value_wei,
         el_address,
         destination,
         gas,
@@ -132,32 +188,40 @@ class BridgeMixin(BaseMixin):
 
         transaction = {
             "from": el_address,
-            "to": PRECOMPILE_BRIDGEOUT_ADDRESS,
-            "value": deposit_amount * SATS_TO_WEI,
+            "to": BRIDGEOUT_ADDRESS,
+            "value": value_wei,
             "gas": gas,
             "data": data_bytes,
         }
         l2_tx_hash = self.web3.eth.send_transaction(transaction)
         return l2_tx_hash
 
-    def __estimate_withdraw_gas(self, deposit_amount, el_address, destination):
+    def __estimate_withdraw_gas(self, value_wei, el_address, destination):
         """
         Estimate the gas for the withdrawal transaction.
+        The estimate is computed once per (from, value, destination) and reused afterwards.
 
         NOTE: The withdrawal destination is a Bitcoin Output Script Descriptor (BOSD).
         """
 
         assert is_valid_bosd(destination), "Invalid BOSD"
 
+        key = (el_address, value_wei, destination)
+        gas = self._withdraw_gas_estimates.get(key)
+        if gas is not None:
+            return gas
+
         data_bytes = bytes.fromhex(destination)
 
         transaction = {
             "from": el_address,
-            "to": PRECOMPILE_BRIDGEOUT_ADDRESS,
-            "value": deposit_amount * SATS_TO_WEI,
+            "to": BRIDGEOUT_ADDRESS,
+            "value": value_wei,
             "data": data_bytes,
         }
-        return self.web3.eth.estimate_gas(transaction)
+        gas = self.web3.eth.estimate_gas(transaction)
+        self._withdraw_gas_estimates[key] = gas
+        return gas
 
     def make_drt(self, el_address, musig_bridge_pk):
         """
@@ -165,29 +229,57 @@ class BridgeMixin(BaseMixin):
 
         Returns the transaction id of the DRT on the bitcoin regtest.
         """
-        # Get relevant data
-        btc_url = self.btcrpc.base_url
-        btc_user = self.btc.get_prop("rpc_user")
-        btc_password = self.btc.get_prop("rpc_password")
-        seq_addr = self.seq.get_prop("address")
+        drt_tx_id = self.send_drt(el_address, musig_bridge_pk)
+        self.mature_drts()
+        return drt_tx_id
+
+    def send_drt(self, el_address, musig_bridge_pk) -> str:
+        """
+        Creates and broadcasts a Deposit Request Transaction, without mining it.
 
+        Returns the transaction id of the DRT on the bitcoin regtest.
+        """
         # Create the deposit request transaction
-        tx = bytes(
-            deposit_request_transaction(
-                el_address, musig_bridge_pk, btc_url, btc_user, btc_password
-            )
-        ).hex()
+        tx = deposit_request_transaction_hex(
+            el_address,
+            musig_bridge_pk,
+            self.btcrpc.base_url,
+            self._btc_user,
+            self._btc_password,
+        )
 
         # Send the transaction to the Bitcoin network
         drt_tx_id: str = self.btcrpc.proxy.sendrawtransaction(tx)
+        return drt_tx_id
 
-        time.sleep(1)
+    def mature_drts(self):
+        """
+        Mines the blocks needed for the broadcast DRTs and the resulting DTs to mature.
+
+        NOTE: these are two rounds on purpose, they can't be merged into a single
+        `generatetoaddress(12)`. The DTs are only created by the operators once they see
+        the matured DRTs, so the second round has to be mined after that.
+        """
+        seq_addr = self._seq_addr
+
+        # NOTE: the DRTs are already in the mempool once `sendrawtransaction` returns.
 
         # time to mature DRT
         self.btcrpc.proxy.generatetoaddress(6, seq_addr)
-        time.sleep(3)
+        self.__wait_seq_l1_tip()
 
         # time to mature DT
         self.btcrpc.proxy.generatetoaddress(6, seq_addr)
-        time.sleep(3)
-        return drt_tx_id
+        self.__wait_seq_l1_tip()
+
+    def __wait_seq_l1_tip(self):
+        """
+        Waits until the sequencer has seen the current bitcoin tip.
+        """
+        tip_height = self.btcrpc.proxy.getblockcount()
+        wait_until(
+            lambda: self.seqrpc.strata_l1status()["cur_height"] >= tip_height,
+            error_with="Sequencer didn't catch up with the L1 tip",
+            timeout=10,
+            step=0.2,
+        )
@@ -3,7 +3,6 @@ from solcx import install_solc, set_solc_version
 from strata_utils import extract_p2tr_pubkey, xonlypk_to_descriptor
 
 from mixins import bridge_mixin
-from utils import get_bridge_pubkey
 from utils.transaction import SmartContracts
 
 
@@ -16,7 +15,6 @@ class BridgePrecompileMixin(bridge_mixin.BridgeMixin):
 
         self.withdraw_address = ctx.env.gen_ext_btc_address()
         self.el_address = self.eth_account.address
-        self.bridge_pk = get_bridge_pubkey(self.seqrpc)
         self.web3.eth.default_account = self.web3.address
         self.contract = self._deploy_contract()
         xonlypk = extract_p2tr_pubkey(self.withdraw_address)
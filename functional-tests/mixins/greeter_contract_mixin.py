@@ -0,0 +1,51 @@
+import flexitest
+
+from . import BaseMixin
+
+SOLC_VERSION = "0.8.16"
+
+GREETER_SOURCE = """
+pragma solidity ^0.8.0;
+
+contract Greeter {
+    string public greeting;
+
+    constructor() public {
+        greeting = 'Hello';
+    }
+}
+"""
+
+
+class GreeterContractMixin(BaseMixin):
+    """
+    Mixin for the tests that need an EL block with some state changes in it.
+    Deploys a trivial contract and keeps the hash of the block it landed in.
+    """
+
+    def premain(self, ctx: flexitest.RunContext):
+        super().premain(ctx)
+
+        # NOTE: solcx is imported in place, as in `SmartContracts._ensure_solc`.
+        # solc is installed here rather than in the tests' `__init__`, so it's only
+        # done for the tests that actually get to run.
+        import solcx
+
+        solcx.install_solc(version=SOLC_VERSION)
+        solcx.set_solc_version(SOLC_VERSION)
+
+        self.web3.eth.default_account = self.web3.address
+
+        # Deploy the contract
+        compiled_sol = solcx.compile_source(GREETER_SOURCE, output_values=["abi", "bin"])
+        _, contract_interface = compiled_sol.popitem()
+        contract = self.web3.eth.contract(
+            abi=contract_interface["abi"], bytecode=contract_interface["bin"]
+        )
+        tx_hash = contract.constructor().transact()
+        tx_receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)
+
+        # Get the block hash where contract was deployed
+        assert tx_receipt["status"] == 1
+        blocknum = tx_receipt.blockNumber
+        self.deploy_blockhash = self.rethrpc.eth_getBlockByNumber(hex(blocknum), False)["hash"]
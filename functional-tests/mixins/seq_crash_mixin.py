@@ -1,4 +1,3 @@
-import time
 from collections.abc import Callable
 
 import flexitest
@@ -28,15 +27,26 @@ class SeqCrashMixin(BaseMixin):
 
         Returns the chain_tip_slot before the bailout.
         """
-        time.sleep(2)
-        cur_chain_tip = self.seqrpc.strata_syncStatus()["tip_height"]
+        # Poll the sequencer going down and coming back up at a short interval by default,
+        # both usually happen well within the default step.
+        kwargs.setdefault("step", 0.1)
+
+        # The sync status is only available after genesis, probe for it
+        # instead of sleeping for a fixed time.
+        cur_chain_tip = wait_until_with_value(
+            lambda: self.seqrpc.strata_syncStatus()["tip_height"],
+            predicate=lambda tip: tip is not None,
+            error_with="Sequencer sync status is not available",
+            step=0.1,
+        )
 
         # Trigger the bailout
         self.seqrpc.debug_bail(bail_tag())
 
-        # Ensure the sequencer bails out
+        # Ensure the sequencer bails out. The bail exits the process, so watch
+        # the process itself rather than hammering its RPC until it's gone.
         wait_until(
-            lambda: check_sequencer_down(self.seqrpc),
+            lambda: not self.seq.check_status(),
             error_with="Sequencer didn't bail out",
             **kwargs,
         )
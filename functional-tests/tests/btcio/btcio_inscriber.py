@@ -2,7 +2,7 @@ import flexitest
 from bitcoinlib.services.bitcoind import BitcoindClient
 
 from envs import testenv
-from utils import generate_n_blocks, submit_da_blob, wait_until
+from utils import generate_n_blocks, submit_da_blob, wait_for_rpc_ready
 
 
 @flexitest.register
@@ -20,16 +20,13 @@ class L1WriterTest(testenv.StrataTester):
         generate_n_blocks(btcrpc, 5)
 
         # Wait for seq
-        wait_until(
-            lambda: seqrpc.strata_protocolVersion() is not None,
-            error_with="Sequencer did not start on time",
-        )
+        wait_for_rpc_ready(seqrpc, error_with="Sequencer did not start on time")
 
         # Submit blob
         blobdata = "2c4253d512da5bb4223f10e8e6017ede69cc63d6e6126916f4b68a1830b7f805"
         tx = submit_da_blob(btcrpc, seqrpc, blobdata)
 
-        assert any([blobdata in w.hex() for w in tx.inputs[0].witnesses]), (
+        assert any(blobdata in w.hex() for w in tx.inputs[0].witnesses), (
             "Tx should have submitted blobdata in its witness"
         )
 
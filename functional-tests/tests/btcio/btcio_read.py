@@ -1,5 +1,4 @@
 import logging
-import time
 
 import flexitest
 from bitcoinlib.services.bitcoind import BitcoindClient
@@ -31,30 +30,36 @@ class L1StatusTest(testenv.StrataTester):
         # Wait for seq
         wait_for_genesis(seqrpc, timeout=30)
 
-        time.sleep(3)
-
-        received_block = btcrpc.getblock(btcrpc.proxy.getbestblockhash())
-        l1stat = seqrpc.strata_l1status()
-
-        # Time is in millis
-        cur_time = l1stat["last_update"] // 1000
+        # wait until the sequencer has read up to the bitcoin tip
+        block_height = btcrpc.proxy.getblockcount()
+        l1stat = wait_until_with_value(
+            seqrpc.strata_l1status,
+            lambda v: v["cur_height"] >= block_height,
+            error_with="Sequencer didn't read up to the bitcoin tip",
+            timeout=3,
+            initial=0.05,
+        )
 
         # check if height on bitcoin is same as, it is seen in sequencer
         logging.info(f"L1 stat curr height: {l1stat['cur_height']}")
-        logging.info(f"Received from bitcoin: {received_block['height']}")
+        logging.info(f"Received from bitcoin: {block_height}")
         seq_height = l1stat["cur_height"]
-        block_height = received_block["height"]
         assert seq_height == block_height, (
             f"sequencer height {seq_height} doesn't match the bitcoin node height {block_height}"
         )
 
         # generate 2 more btc blocks
         generate_n_blocks(btcrpc, 2)
-        time.sleep(MAX_HORIZON_POLL_INTERVAL_SECS * 2)
-
-        next_l1stat = seqrpc.strata_l1status()
-        elapsed_time = next_l1stat["last_update"] // 1000
+        next_l1stat = wait_until_with_value(
+            seqrpc.strata_l1status,
+            lambda v: v["cur_height"] >= seq_height + 2,
+            error_with="new blocks not read",
+            timeout=MAX_HORIZON_POLL_INTERVAL_SECS * 2,
+            initial=0.05,
+        )
 
         # check if L1 reader is seeing new L1 activity
         assert next_l1stat["cur_height"] - l1stat["cur_height"] == 2, "new blocks not read"
-        assert elapsed_time > cur_time, "time not flowing properly"
+        # Time is in millis. Compared as is, since without the fixed sleeps both updates
+        # can happen within the same second.
+        assert next_l1stat["last_update"] > l1stat["last_update"], "time not flowing properly"
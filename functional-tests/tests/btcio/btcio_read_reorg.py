@@ -1,5 +1,3 @@
-import time
-
 import flexitest
 from bitcoinlib.services.bitcoind import BitcoindClient
 
@@ -36,6 +34,8 @@ class L1ReadReorgTest(testenv.StrataTester):
         self.info(f"height to invalidate from {invalidate_height}")
 
         block_to_invalidate_from = btcrpc.proxy.getblockhash(invalidate_height)
+        # What the sequencer has above it before the reorg, it has to be replaced.
+        pre_reorg_block = seqrpc.strata_getL1blockHash(invalidate_height + 1)
 
         # Invalid block
         self.info(f"invalidating block {block_to_invalidate_from}")
@@ -43,8 +43,13 @@ class L1ReadReorgTest(testenv.StrataTester):
 
         to_be_invalid_block = seqrpc.strata_getL1blockHash(invalidate_height)
         # Wait for at least 1 block to be added after invalidating `REORG_DEPTH` blocks.
-        time.sleep(BLOCK_GENERATION_INTERVAL_SECS * 1 + SEQ_SLACK_TIME_SECS)
-        block_from_invalidated_height = seqrpc.strata_getL1blockHash(invalidate_height + 1)
+        block_from_invalidated_height = wait_until_with_value(
+            lambda: seqrpc.strata_getL1blockHash(invalidate_height + 1),
+            lambda h: h is not None and h != pre_reorg_block,
+            error_with=f"Expected reorg from block {invalidate_height}",
+            timeout=BLOCK_GENERATION_INTERVAL_SECS + SEQ_SLACK_TIME_SECS + 5,
+            initial=0.1,
+        )
 
         self.info(f"now have block {block_from_invalidated_height}")
 
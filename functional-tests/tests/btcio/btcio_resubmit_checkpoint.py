@@ -5,9 +5,10 @@ from envs import testenv
 from utils import (
     ProverClientSettings,
     RollupParamsSettings,
+    find_envelope_pushdata,
     generate_n_blocks,
-    get_envelope_pushdata,
     submit_da_blob,
+    wait_for_rpc_ready,
     wait_until,
     wait_until_with_value,
 )
@@ -36,10 +37,7 @@ class ResubmitCheckpointTest(testenv.StrataTester):
         generate_n_blocks(btcrpc, 5)
 
         # Wait for seq
-        wait_until(
-            lambda: seqrpc.strata_protocolVersion() is not None,
-            error_with="Sequencer did not start on time",
-        )
+        wait_for_rpc_ready(seqrpc, error_with="Sequencer did not start on time")
 
         verified_on = wait_until_with_value(
             lambda: seqrpc.strata_getL2BlockStatus(1),
@@ -48,22 +46,12 @@ class ResubmitCheckpointTest(testenv.StrataTester):
             timeout=30,
         )
         verified_block_hash = btcrpc.proxy.getblockhash(verified_on["Finalized"])
-        block_data = btcrpc.getblock(verified_block_hash)
-        envelope_data = ""
-        for tx in block_data["txs"]:
-            try:
-                envelope_data = get_envelope_pushdata(tx.witness_data().hex())
-            except ValueError:
-                print("Not an envelope transaction")
-                continue
+        envelope_data = find_envelope_pushdata(btcrpc, verified_block_hash)
 
-        tx = submit_da_blob(btcrpc, seqrpc, envelope_data)
+        submit_da_blob(btcrpc, seqrpc, envelope_data)
 
         # ensure that client is still up and running
-        wait_until(
-            lambda: seqrpc.strata_protocolVersion() is not None,
-            error_with="sequencer rpc is not working",
-        )
+        wait_for_rpc_ready(seqrpc, error_with="sequencer rpc is not working")
 
         # check if chain tip is being increased
         cur_chain_tip = seqrpc.strata_clientStatus()["chain_tip_slot"]
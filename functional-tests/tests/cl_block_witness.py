@@ -3,7 +3,7 @@ import time
 import flexitest
 
 from envs import testenv
-from utils import wait_until
+from utils import wait_for_rpc_ready
 
 REORG_DEPTH = 3
 
@@ -18,10 +18,7 @@ class CLBlockWitnessDataGenerationTest(testenv.StrataTester):
         seqrpc = seq.create_rpc()
 
         # Wait for seq
-        wait_until(
-            lambda: seqrpc.strata_protocolVersion() is not None,
-            error_with="Sequencer did not start on time",
-        )
+        wait_for_rpc_ready(seqrpc, error_with="Sequencer did not start on time")
 
         witness_1 = self.get_witness(seqrpc, 1)
         assert witness_1 is not None
@@ -6,8 +6,9 @@ from bitcoinlib.services.bitcoind import BitcoindClient
 
 from envs import testenv
 from utils import (
-    get_envelope_pushdata,
+    find_envelope_pushdata,
     submit_da_blob,
+    wait_for_rpc_ready,
     wait_until,
     wait_until_epoch_finalized,
     wait_until_with_value,
@@ -76,22 +77,24 @@ class IgnoreCheckpointWithInvalidProofTest(testenv.StrataTester):
         fullnode.stop()
 
         # Wait for seq_fast to start
-        wait_until(
-            lambda: seqrpc_fast.strata_protocolVersion() is not None,
-            error_with="Sequencer (fast) did not start on time",
-        )
+        wait_for_rpc_ready(seqrpc_fast, error_with="Sequencer (fast) did not start on time")
 
         # Wait for the fast sequencer to create the first 3 epochs
         wait_until_epoch_finalized(seqrpc_fast, 3, timeout=60)
 
         # Stop the fast prover so the next epoch's proof is not generated automatically
         prover_fast.stop()
-        # Sleep briefly to allow the new epoch (epoch 4) to begin
-        time.sleep(5)
+        # Wait for the new epoch (epoch 4) to begin
+        current_epoch = wait_until_with_value(
+            lambda: seqrpc_fast.strata_getLatestCheckpointIndex(None),
+            predicate=lambda v: v is not None and v >= 4,
+            error_with="Epoch 4 didn't begin on the fast sequencer",
+            timeout=30,
+            initial=0.1,
+        )
 
         # Manually submit an empty proof for epoch 4 via the fast sequencer
         empty_proof_receipt = {"proof": [], "public_values": []}
-        current_epoch = seqrpc_fast.strata_getLatestCheckpointIndex(None)
         logging.info(f"current_epoch on fast sequencer: {current_epoch}")  # Should be 4
 
         seqrpc_fast.strataadmin_submitCheckpointProof(current_epoch, empty_proof_receipt)
@@ -122,18 +125,10 @@ class IgnoreCheckpointWithInvalidProofTest(testenv.StrataTester):
         )
         # Get the L1 block containing the checkpoint transaction with the empty proof
         verified_block_hash = btcrpc.proxy.getblockhash(verified_on["Finalized"])
-        block_data = btcrpc.getblock(verified_block_hash)
-        envelope_data = ""
         # Extract the DA envelope data from the transaction witness
-        for tx in block_data["txs"]:
-            try:
-                envelope_data = get_envelope_pushdata(tx.witness_data().hex())
-                logging.info("Found an envelope transaction in L1 block")
-                break  # Assuming only one envelope per block in this test context
-            except ValueError:
-                continue
-        else:
-            raise Exception("Could not find envelope transaction in L1 block {verified_block_hash}")
+        # NOTE: assuming only one envelope per block in this test context
+        envelope_data = find_envelope_pushdata(btcrpc, verified_block_hash)
+        logging.info("Found an envelope transaction in L1 block")
 
         ## Stop fast sequencer related services
         # prover_fast is already stopped
@@ -155,8 +150,13 @@ class IgnoreCheckpointWithInvalidProofTest(testenv.StrataTester):
         ## Check full node has also finalized epoch 3
         wait_until_epoch_finalized(fullnode_rpc, 3, timeout=60)
 
-        # Sleep briefly to allow the new epoch (epoch 4) to begin on the strict nodes
-        time.sleep(5)
+        # Wait for the new epoch (epoch 4) to begin on the strict nodes
+        wait_until(
+            lambda: (seqrpc_strict.strata_getLatestCheckpointIndex(None) or 0) >= 4,
+            error_with="Epoch 4 didn't begin on the strict sequencer",
+            timeout=30,
+            initial=0.1,
+        )
 
         # Submit the previously captured checkpoint (with invalid proof) for epoch 4 to L1
         tx_invalid_resubmit = submit_da_blob(btcrpc, seqrpc_strict, envelope_data)
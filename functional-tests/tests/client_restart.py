@@ -46,7 +46,7 @@ class BlockFinalizationSeqRestartTest(testenv.StrataTester):
         seq.start()
         logging.info("Waiting for it to come back up...")
         seqrpc = seq.create_rpc()
-        wait_until(seqrpc.strata_protocolVersion, timeout=5)
+        wait_for_rpc_ready(seqrpc, timeout=5)
 
         # Check for next 2 checkpoints
         logging.info("Now we look for more checkpoints")
@@ -1,7 +1,7 @@
 import flexitest
 
 from envs import testenv
-from utils import wait_until
+from utils import wait_for_rpc_ready
 
 
 @flexitest.register
@@ -15,12 +15,7 @@ class L1ClientStatusTest(testenv.StrataTester):
         seqrpc = seq.create_rpc()
 
         # Wait for seq
-        wait_until(
-            lambda: seqrpc.strata_protocolVersion() is not None,
-            error_with="Sequencer did not start on time",
-        )
-
-        proto_ver = seqrpc.strata_protocolVersion()
+        proto_ver = wait_for_rpc_ready(seqrpc, error_with="Sequencer did not start on time")
         self.debug(f"protocol version {proto_ver}")
         assert proto_ver == 1, "query protocol version"
 
@@ -11,6 +11,11 @@ NATIVE_TOKEN_TRANSFER_PARAMS = {
     "TRANSFER_AMOUNT": Web3.to_wei(1, "ether"),
 }
 
+# Checksummed once, the addresses are constant.
+DEST_ADDRESS = Web3.to_checksum_address(NATIVE_TOKEN_TRANSFER_PARAMS["DEST_ADDRESS"])
+BASEFEE_ADDRESS = Web3.to_checksum_address(NATIVE_TOKEN_TRANSFER_PARAMS["BASEFEE_ADDRESS"])
+BENEFICIARY_ADDRESS = Web3.to_checksum_address(NATIVE_TOKEN_TRANSFER_PARAMS["BENEFICIARY_ADDRESS"])
+
 
 @flexitest.register
 class ElBalanceTransferTest(testenv.StrataTester):
@@ -22,29 +27,34 @@ class ElBalanceTransferTest(testenv.StrataTester):
         web3: Web3 = reth.create_web3()
 
         source = web3.address
-        dest = web3.to_checksum_address(NATIVE_TOKEN_TRANSFER_PARAMS["DEST_ADDRESS"])
-        basefee_address = web3.to_checksum_address(NATIVE_TOKEN_TRANSFER_PARAMS["BASEFEE_ADDRESS"])
-        beneficiary_address = web3.to_checksum_address(
-            NATIVE_TOKEN_TRANSFER_PARAMS["BENEFICIARY_ADDRESS"]
-        )
+        dest = DEST_ADDRESS
+        basefee_address = BASEFEE_ADDRESS
+        beneficiary_address = BENEFICIARY_ADDRESS
 
         self.debug(f"{web3.is_connected()}")
-        original_block_no = web3.eth.block_number
-        dest_original_balance = web3.eth.get_balance(dest)
-        source_original_balance = web3.eth.get_balance(source)
-        basefee_original_balance = web3.eth.get_balance(basefee_address)
-        beneficiary_original_balance = web3.eth.get_balance(beneficiary_address)
+        addresses = [dest, source, basefee_address, beneficiary_address]
+        original_block_no, original_balances = get_block_number_and_balances(
+            self.rethrpc, addresses
+        )
+        (
+            dest_original_balance,
+            source_original_balance,
+            basefee_original_balance,
+            beneficiary_original_balance,
+        ) = original_balances
 
         self.debug(f"{original_block_no}, {dest_original_balance}")
 
         transfer_amount = NATIVE_TOKEN_TRANSFER_PARAMS["TRANSFER_AMOUNT"]
         _tx_receipt = make_native_token_transfer(web3, transfer_amount, dest)
 
-        final_block_no = web3.eth.block_number
-        dest_final_balance = web3.eth.get_balance(dest)
-        source_final_balance = web3.eth.get_balance(source)
-        basefee_final_balance = web3.eth.get_balance(basefee_address)
-        beneficiary_final_balance = web3.eth.get_balance(beneficiary_address)
+        final_block_no, final_balances = get_block_number_and_balances(self.rethrpc, addresses)
+        (
+            dest_final_balance,
+            source_final_balance,
+            basefee_final_balance,
+            beneficiary_final_balance,
+        ) = final_balances
 
         self.debug(f"{final_block_no}, {dest_final_balance}")
 
@@ -63,3 +73,13 @@ class ElBalanceTransferTest(testenv.StrataTester):
             + transfer_amount
             == 0
         ), "total balance change is not balanced"
+
+
+def get_block_number_and_balances(rethrpc, addresses: list[str]) -> tuple[int, list[int]]:
+    """
+    Reads the latest block number and the balances of `addresses` in a single batch request.
+    """
+    results = rethrpc.call_batch(
+        [("eth_blockNumber", [])] + [("eth_getBalance", [addr, "latest"]) for addr in addresses]
+    )
+    return int(results[0], 16), [int(balance, 16) for balance in results[1:]]
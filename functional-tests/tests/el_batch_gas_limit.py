@@ -1,15 +1,17 @@
-import time
+import functools
 from typing import Optional
 
 import flexitest
-import web3.eth
+from eth_account.signers.local import LocalAccount
 from web3 import Web3
 
 from envs import testenv
+from utils.constants import DEV_ACCOUNT_PRIVATE_KEY
 from utils.reth import get_chainconfig
 from utils.utils import (
     RollupParamsSettings,
-    wait_until,
+    wait_until_el_block,
+    wait_until_stopped,
 )
 
 BLOCK_GAS_LIMIT = 1_000_000
@@ -22,10 +24,6 @@ chain_config = get_chainconfig()
 chain_config["gasLimit"] = hex(BLOCK_GAS_LIMIT)
 
 
-def block_number_available(web3, block_no):
-    return lambda: web3.eth.get_block_number() >= block_no
-
-
 @flexitest.register
 class ElBatchGasLimitTest(testenv.StrataTester):
     def __init__(self, ctx: flexitest.InitContext):
@@ -43,24 +41,41 @@ class ElBatchGasLimitTest(testenv.StrataTester):
     def main(self, ctx: flexitest.RunContext):
         seq_signer = ctx.get_service("sequencer_signer")
         seq_signer.stop()
-        # FIXME: process is NOT terminated immediately so need to wait
-        time.sleep(1)
+        wait_until_stopped(seq_signer, error_with="Sequencer signer did not stop on time")
 
         reth = ctx.get_service("reth")
         web3: Web3 = reth.create_web3()
 
-        source = web3.address
-        nonce = web3.eth.get_transaction_count(source)
+        account = web3.eth.account.from_key(DEV_ACCOUNT_PRIVATE_KEY)
+        source = account.address
+        # Block production is stopped, so the block number can be read before the txns are sent.
+        *quantities, latest_block = self.rethrpc.call_batch(
+            [
+                ("eth_getTransactionCount", [source, "latest"]),
+                ("eth_chainId", []),
+                ("eth_maxPriorityFeePerGas", []),
+                ("eth_getBlockByNumber", ["latest", False]),
+            ]
+        )
+        nonce, chain_id, max_priority_fee = (int(v, 16) for v in quantities)
+        original_block_no = int(latest_block["number"], 16)
+        base_fee = int(latest_block["baseFeePerGas"], 16)
+        # The blocks are over the gas target, so the basefee rises with every block.
+        # Leave the same headroom web3 does, so the txns don't get priced out while queued.
+        max_fee = 2 * base_fee + max_priority_fee
         # send 10 txns with GAS_PER_TX gas each
-        _txids = [
-            make_gas_burner_transaction(web3, source, nonce + i, GAS_PER_TX)
+        # They are signed locally and submitted together in a single batch request.
+        raw_txs = [
+            sign_gas_burner_transaction(
+                account, nonce + i, GAS_PER_TX, max_fee, max_priority_fee, chain_id
+            )
             for i in range(0, TX_COUNT)
         ]
+        txids = self.rethrpc.call_batch([("eth_sendRawTransaction", [tx]) for tx in raw_txs])
+        self.debug(f"txids: {txids}")
         # if all txns are included, epoch gas limit should be crossed
         assert GAS_PER_TX * TX_COUNT > EPOCH_GAS_LIMIT
 
-        original_block_no = web3.eth.get_block_number()
-
         # re-start block production
         seq_signer.start()
 
@@ -70,19 +85,21 @@ class ElBatchGasLimitTest(testenv.StrataTester):
         total_gas_used = 0
         block_no = original_block_no + 1
         zero_gas_blocks = 0
-        while zero_gas_blocks < 2:
-            wait_until(block_number_available(web3, block_no))
+        # one subscription for the whole loop, instead of one per block
+        with self.rethrpc.subscribe("newHeads") as heads:
+            while zero_gas_blocks < 2:
+                wait_until_el_block(self.rethrpc, block_no, heads=heads)
 
-            header = web3.eth.get_block(block_no)
-            self.info(f"block_number: {header['number']}, gas_used: {header['gasUsed']}")
+                header = web3.eth.get_block(block_no)
+                self.info(f"block_number: {header['number']}, gas_used: {header['gasUsed']}")
 
-            if header["gasUsed"] == 0:
-                zero_gas_blocks += 1
-            else:
-                zero_gas_blocks = 0
+                if header["gasUsed"] == 0:
+                    zero_gas_blocks += 1
+                else:
+                    zero_gas_blocks = 0
 
-            total_gas_used += header["gasUsed"]
-            block_no += 1
+                total_gas_used += header["gasUsed"]
+                block_no += 1
 
         self.info(f"total gas used: {total_gas_used}")
 
@@ -90,32 +107,48 @@ class ElBatchGasLimitTest(testenv.StrataTester):
         assert total_gas_used < GAS_PER_TX * TX_COUNT, "all txns should NOT be processed"
 
 
-def make_gas_burner_transaction(
-    web3: web3.Web3, address: str, nonce: int, burn_gas: int, gas_limit: Optional[int] = None
-):
+def sign_gas_burner_transaction(
+    account: LocalAccount,
+    nonce: int,
+    burn_gas: int,
+    max_fee_per_gas: int,
+    max_priority_fee_per_gas: int,
+    chain_id: int,
+    gas_limit: Optional[int] = None,
+) -> str:
     """
-    Performs a transaction to own account with a large calldata.
+    Signs a transaction to own account with a large calldata.
     Sends enough calldata to consume `burn_gas` gas.
     Note: reth has default calldata limit of 128kb = ~ 2M gas
 
-    :param web3: Web3 instance.
-    :param address: account address
+    :param account: Local account signing the transaction.
     :param nonce: custom nonce for queueing multiple txns
     :param burn_gas: Amount of gas to burn through calldata.
+    :param max_fee_per_gas: Max fee per gas of the (EIP-1559) transaction.
+    :param max_priority_fee_per_gas: Max priority fee per gas of the transaction.
+    :param chain_id: Chain id to sign for.
     :param gas_limit: Custom gas limit to use.
-    :return: Transaction id
+    :return: Signed raw transaction, hex encoded
     """
-    # each non-zero byte calldata consumes 16 gas
-    data = "0x" + "01" * (burn_gas // 16)
-
     tx_params = {
-        "to": address,
+        "to": account.address,
         "value": 0,
         "gas": gas_limit or burn_gas + 21000,
-        "data": data,
-        "from": address,
-        "nonce": hex(nonce),
+        "type": 2,
+        "maxFeePerGas": max_fee_per_gas,
+        "maxPriorityFeePerGas": max_priority_fee_per_gas,
+        "data": gas_burner_calldata(burn_gas),
+        "nonce": nonce,
+        "chainId": chain_id,
     }
-    txid = web3.eth.send_transaction(tx_params)
-    print("txid", txid.to_0x_hex())
-    return txid
+    return account.sign_transaction(tx_params).raw_transaction.to_0x_hex()
+
+
+@functools.cache
+def gas_burner_calldata(burn_gas: int) -> bytes:
+    """
+    Builds the calldata consuming `burn_gas` gas, once per amount as it's the same
+    for all the transactions of a test.
+    """
+    # each non-zero byte calldata consumes 16 gas
+    return b"\x01" * (burn_gas // 16)
@@ -1,10 +1,9 @@
 import logging
-import time
 
 import flexitest
 
 from envs import testenv
-from utils import wait_for_genesis
+from utils import wait_for_genesis, wait_until_el_block
 
 
 @flexitest.register
@@ -23,8 +22,12 @@ class ElBlockGenerationTest(testenv.StrataTester):
         logging.info(f"initial EL blocknum is {last_blocknum}")
 
         for _ in range(5):
-            time.sleep(3)
-            cur_blocknum = int(rethrpc.eth_blockNumber(), 16)
+            cur_blocknum = wait_until_el_block(
+                rethrpc,
+                last_blocknum + 1,
+                error_with="seem to not be making progress",
+                timeout=3,
+            )
             logging.info(f"current EL blocknum is {cur_blocknum}")
             assert cur_blocknum >= last_blocknum, "cur block went backwards"
             assert cur_blocknum > last_blocknum, "seem to not be making progress"
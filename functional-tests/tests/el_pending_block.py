@@ -1,6 +1,7 @@
 import flexitest
 
 from envs import testenv
+from utils.constants import DEV_ACCOUNT_ADDRESS
 
 
 @flexitest.register
@@ -9,22 +10,24 @@ class ElPendingBlock(testenv.StrataTester):
         ctx.set_env("basic")
 
     def main(self, ctx: flexitest.RunContext):
-        reth = ctx.get_service("reth")
-        address = reth.create_web3().address
-
-        rethrpc = reth.create_rpc()
-        block = rethrpc.eth_getBlockByNumber("pending", True)
-
-        assert block is not None, "get pending block"
-
-        gas = rethrpc.eth_estimateGas(
-            {
-                "chainId": "0x3039",
-                "from": address,
-                "to": "0x" + "00" * 20,
-                "nonce": "0x0",
-            },
-            "pending",
+        # The sender is the dev account, so both calls are independent and can be batched.
+        block, gas = self.rethrpc.call_batch(
+            [
+                ("eth_getBlockByNumber", ["pending", True]),
+                (
+                    "eth_estimateGas",
+                    [
+                        {
+                            "chainId": "0x3039",
+                            "from": DEV_ACCOUNT_ADDRESS,
+                            "to": "0x" + "00" * 20,
+                            "nonce": "0x0",
+                        },
+                        "pending",
+                    ],
+                ),
+            ]
         )
 
+        assert block is not None, "get pending block"
         assert gas is not None, "estimate gas on pending block"
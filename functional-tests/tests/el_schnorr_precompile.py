@@ -5,7 +5,7 @@ from envs import testenv
 from utils.schnorr import (
     get_precompile_input,
     get_test_schnnor_secret_key,
-    make_schnorr_precompile_call,
+    make_schnorr_precompile_calls,
 )
 
 
@@ -30,15 +30,20 @@ class SchnorrPrecompileTest(testenv.StrataTester):
         secret_key = get_test_schnnor_secret_key()
         msg = "AlpenStrata"
         precompile_input = get_precompile_input(secret_key, msg)
-        _txid, data = make_schnorr_precompile_call(web3, precompile_input)
-        assert data == "0x01", f"Schnorr verification failed: expected '0x01', got '{data}'."
 
         another_message = "MakaluStrata"
         another_precompile_input = get_precompile_input(secret_key, another_message)
 
         # Precompile input: Public Key (64) || Message Hash (64) || Signature (128)
         modified_precompile_input = another_precompile_input[:-128] + precompile_input[-128:]
-        _txid, data = make_schnorr_precompile_call(web3, modified_precompile_input)
-        assert data == "0x00", f"Schnorr verification failed: expected '0x00', got '{data}'."
+
+        # Both cases are independent, run them together.
+        (_txid, data), (_txid, modified_data) = make_schnorr_precompile_calls(
+            web3, self.rethrpc, [precompile_input, modified_precompile_input]
+        )
+        assert data == "0x01", f"Schnorr verification failed: expected '0x01', got '{data}'."
+        assert modified_data == "0x00", (
+            f"Schnorr verification failed: expected '0x00', got '{modified_data}'."
+        )
 
         return True
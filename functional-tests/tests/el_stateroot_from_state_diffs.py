@@ -1,8 +1,10 @@
-import time
-
 import flexitest
 
 from envs import testenv
+from utils import wait_until_el_block
+
+# Enough blocks for the load generator to have touched a good amount of state.
+TARGET_BLOCK = 20
 
 
 @flexitest.register
@@ -13,13 +15,16 @@ class ElBlockStateDiffDataGenerationTest(testenv.StrataTester):
     def main(self, ctx: flexitest.RunContext):
         reth = ctx.get_service("reth")
         rethrpc = reth.create_rpc()
-        time.sleep(20)
-
-        block = int(rethrpc.eth_blockNumber(), base=16)
+        block = wait_until_el_block(rethrpc, TARGET_BLOCK, timeout=40)
         self.info(f"Latest reth block={block}")
 
-        reconstructed_root = rethrpc.strataee_getStateRootByDiffs(block)
-        actual_root = rethrpc.eth_getBlockByNumber(hex(block), False)["stateRoot"]
+        reconstructed_root, actual_block = rethrpc.call_batch(
+            [
+                ("strataee_getStateRootByDiffs", [block]),
+                ("eth_getBlockByNumber", [hex(block), False]),
+            ]
+        )
+        actual_root = actual_block["stateRoot"]
         self.info(f"reconstructed state root = {reconstructed_root}")
         self.info(f"actual state root = {actual_root}")
 
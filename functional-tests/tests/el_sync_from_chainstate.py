@@ -81,8 +81,9 @@ class ELSyncFromChainstateTest(testenv.StrataTester):
         seq.start()
 
         # generate more blocks
-        wait_until(
-            lambda: int(rethrpc.eth_blockNumber(), base=16) > orig_blocknumber + 1,
+        wait_until_el_block(
+            rethrpc,
+            orig_blocknumber + 2,
             error_with="not building blocks",
             timeout=5,
         )
@@ -115,8 +116,9 @@ class ELSyncFromChainstateTest(testenv.StrataTester):
         seq.start()
 
         print("wait for sync")
-        wait_until(
-            lambda: int(rethrpc.eth_blockNumber(), base=16) > final_blocknumber,
+        wait_until_el_block(
+            rethrpc,
+            final_blocknumber + 1,
             error_with="not syncing blocks",
             timeout=10,
         )
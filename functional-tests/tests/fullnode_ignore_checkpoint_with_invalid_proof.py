@@ -1,10 +1,10 @@
 import logging
-import time
 
 import flexitest
 
 from envs import testenv
 from utils import (
+    wait_for_rpc_ready,
     wait_until,
     wait_until_epoch_finalized,
 )
@@ -13,6 +13,10 @@ PROVER_CHECKPOINT_SETTINGS = {
     "CONSECUTIVE_PROOFS_REQUIRED": 4,
 }
 
+# The nodes expose no epoch notifications, so the waits poll with a backoff instead:
+# quick to notice fast progress without hammering the nodes on the slow steps.
+BACKOFF_POLL = {"initial": 0.1, "backoff": 1.5, "cap": 2.0}
+
 
 @flexitest.register
 class FullnodeIgnoreCheckpointWithInvalidProofTest(testenv.StrataTester):
@@ -49,20 +53,11 @@ class FullnodeIgnoreCheckpointWithInvalidProofTest(testenv.StrataTester):
         seq_fast_rpc = seq_fast.create_rpc()
         fullnode_rpc = fullnode.create_rpc()
 
-        # Sleep for 3 seconds to ensure that the sequencer has time to start
-        time.sleep(3)
-
         # Wait for seq_fast to start
-        wait_until(
-            lambda: seq_fast_rpc.strata_protocolVersion() is not None,
-            error_with="Sequencer (fast) did not start on time",
-        )
+        wait_for_rpc_ready(seq_fast_rpc, error_with="Sequencer (fast) did not start on time")
 
         # Wait for fullnode to start
-        wait_until(
-            lambda: fullnode_rpc.strata_protocolVersion() is not None,
-            error_with="Fullnode did not start on time",
-        )
+        wait_for_rpc_ready(fullnode_rpc, error_with="Fullnode did not start on time")
 
         empty_proof_receipt = {"proof": [], "public_values": []}
 
@@ -71,6 +66,7 @@ class FullnodeIgnoreCheckpointWithInvalidProofTest(testenv.StrataTester):
         wait_until(
             lambda: seq_fast_rpc.strata_getLatestCheckpointIndex(None) == current_epoch,
             error_with="Checkpoint index did not increment",
+            **BACKOFF_POLL,
         )
 
         for _ in range(PROVER_CHECKPOINT_SETTINGS["CONSECUTIVE_PROOFS_REQUIRED"]):
@@ -86,17 +82,18 @@ class FullnodeIgnoreCheckpointWithInvalidProofTest(testenv.StrataTester):
                 )
                 == current_epoch + 1,
                 error_with="Checkpoint index did not increment",
+                **BACKOFF_POLL,
             )
 
             current_epoch += 1
             logging.info(f"Epoch advanced to {current_epoch}")
 
         logging.info("Waiting for epoch 3 to be finalized in the fast sequencer")
-        wait_until_epoch_finalized(seq_fast_rpc, 3, timeout=20)
+        wait_until_epoch_finalized(seq_fast_rpc, 3, timeout=20, **BACKOFF_POLL)
 
         try:
             logging.info("Checking if epoch 3 is finalized in the fullnode")
-            wait_until_epoch_finalized(fullnode_rpc, 3, timeout=20)
+            wait_until_epoch_finalized(fullnode_rpc, 3, timeout=20, **BACKOFF_POLL)
             logging.warn("Fullnode incorrectly finalized epoch 3")
             return False
         except Exception:
@@ -1,9 +1,10 @@
-import time
-
 import flexitest
 
 from envs import testenv
-from utils import wait_for_proof_with_time_out
+from utils import wait_for_proof_with_time_out, wait_until_el_block
+
+# About what the load generator used to get in a fixed 30s wait, at 1s block time.
+MIN_BLOCK = 30
 
 
 @flexitest.register
@@ -18,9 +19,9 @@ class BasicLoadGenerationTest(testenv.StrataTester):
         rethrpc = reth.create_rpc()
 
         # Wait for some blocks with transactions to be generated.
-        time.sleep(30)
-
-        block = int(rethrpc.eth_blockNumber(), base=16)
+        block = wait_until_el_block(
+            rethrpc, MIN_BLOCK, error_with="Not enough blocks generated", timeout=60
+        )
         print(f"Latest reth block={block}")
         self.test_checkpoint(50, block, prover_client_rpc)
 
@@ -2,7 +2,11 @@ import flexitest
 from bitcoinlib.services.bitcoind import BitcoindClient
 
 from envs import testenv
-from utils import bytes_to_big_endian, cl_slot_to_block_id, wait_for_proof_with_time_out, wait_until
+from utils import (
+    bytes_to_big_endian,
+    wait_for_proof_with_time_out,
+    wait_for_rpc_ready,
+)
 
 CHECKPOINT_PROVER_PARAMS = {
     "checkpoint_idx": 1,
@@ -28,28 +32,30 @@ class ProverClientTest(testenv.StrataTester):
         btcrpc: BitcoindClient = btc.create_rpc()
 
         # Wait until the prover client reports readiness
-        wait_until(
-            lambda: prover_client_rpc.dev_strata_getReport() is not None,
+        wait_for_rpc_ready(
+            prover_client_rpc,
+            "dev_strata_getReport",
             error_with="Prover did not start on time",
         )
 
         # L1 Range
-        height = CHECKPOINT_PROVER_PARAMS["l1_range"][0]
-        blockhash = bytes_to_big_endian(btcrpc.proxy.getblockhash(height))
-        l1_start_block_commitment = {"height": height, "blkid": blockhash}
-
-        height = CHECKPOINT_PROVER_PARAMS["l1_range"][1]
-        blockhash = bytes_to_big_endian(btcrpc.proxy.getblockhash(height))
-        l1_end_block_commitment = {"height": height, "blkid": blockhash}
+        l1_start, l1_end = CHECKPOINT_PROVER_PARAMS["l1_range"]
+        l1_start_hash, l1_end_hash = btcrpc.proxy.batch_(
+            [["getblockhash", l1_start], ["getblockhash", l1_end]]
+        )
+        l1_start_block_commitment = {
+            "height": l1_start,
+            "blkid": bytes_to_big_endian(l1_start_hash),
+        }
+        l1_end_block_commitment = {"height": l1_end, "blkid": bytes_to_big_endian(l1_end_hash)}
 
         # L2 Range
-        slot = CHECKPOINT_PROVER_PARAMS["l2_range"][0]
-        block_id = cl_slot_to_block_id(seqrpc, slot)
-        l2_start_block_commitment = {"slot": slot, "blkid": block_id}
-
-        slot = CHECKPOINT_PROVER_PARAMS["l2_range"][1]
-        block_id = cl_slot_to_block_id(seqrpc, slot)
-        l2_end_block_commitment = {"slot": slot, "blkid": block_id}
+        l2_start, l2_end = CHECKPOINT_PROVER_PARAMS["l2_range"]
+        l2_start_headers, l2_end_headers = seqrpc.call_batch(
+            [("strata_getHeadersAtIdx", [l2_start]), ("strata_getHeadersAtIdx", [l2_end])]
+        )
+        l2_start_block_commitment = {"slot": l2_start, "blkid": l2_start_headers[0]["block_id"]}
+        l2_end_block_commitment = {"slot": l2_end, "blkid": l2_end_headers[0]["block_id"]}
 
         task_ids = prover_client_rpc.dev_strata_proveCheckpointRaw(
             CHECKPOINT_PROVER_PARAMS["checkpoint_idx"],
@@ -42,7 +42,7 @@ class ElCalldataTransactionProofTest(testenv.StrataTester):
 
         # Wait until the end EE block is generated.
         wait_until_with_value(
-            lambda: web3.eth.get_block("latest")["number"],
+            lambda: web3.eth.block_number,
             lambda height: height >= ee_prover_params["end_block"],
             error_with="EE blocks not generated",
         )
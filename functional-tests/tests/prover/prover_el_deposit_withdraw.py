@@ -8,7 +8,6 @@ from envs.rollup_params_cfg import RollupConfig
 from mixins import bridge_mixin
 from utils import (
     confirm_btc_withdrawal,
-    get_bridge_pubkey,
     wait_for_proof_with_time_out,
     wait_until,
 )
@@ -36,13 +35,11 @@ class ProverDepositWithdrawTest(bridge_mixin.BridgeMixin):
         return True
 
         evm_addr = self.eth_account.address
-        bridge_pk = get_bridge_pubkey(self.seqrpc)
+        bridge_pk = self.bridge_pk
 
         # Init RPCs.
-        btc = ctx.get_service("bitcoin")
-        btcrpc: BitcoindClient = btc.create_rpc()
-        reth = ctx.get_service("reth")
-        rethrpc = reth.create_rpc()
+        btcrpc: BitcoindClient = self.btcrpc
+        rethrpc = self.rethrpc
         prover_client = ctx.get_service("prover_client")
         prover_client_rpc = prover_client.create_rpc()
         # Wait some time until the prover client has loaded the ELFs and ready to accept RPCs.
@@ -56,24 +53,31 @@ class ProverDepositWithdrawTest(bridge_mixin.BridgeMixin):
         # Do deposit on the L1.
         # Fix the strata block first (to optimize the search).
         start_block = int(rethrpc.eth_blockNumber(), base=16)
-        l1_deposit_txn_id = self.deposit(ctx, evm_addr, bridge_pk)
         # Do twice the deposit, so the withdrawal will have funds for the gas.
-        _ = self.deposit(ctx, evm_addr, bridge_pk)
+        l1_deposit_txn_id, _ = self.deposit_batch(ctx, evm_addr, bridge_pk, 2)
 
         # Collect the L1 and L2 blocks where the deposit transaction was included.
         l1_deposit_tx_info = btcrpc.proxy.getrawtransaction(l1_deposit_txn_id, 1)
         l1_deposit_blockhash = l1_deposit_tx_info["blockhash"]
-        l1_deposit_block_height = btcrpc.proxy.getblock(l1_deposit_blockhash, 1)["height"]
+        l1_deposit_block_height = btcrpc.proxy.getblockheader(l1_deposit_blockhash)["height"]
         self.info(f"deposit block height on L1: {l1_deposit_block_height}")
 
-        l2_deposit_block_num = None
         end_block = int(rethrpc.eth_blockNumber(), base=16)
-        for block_num in range(start_block, end_block + 1):
-            block = rethrpc.eth_getBlockByNumber(hex(block_num), True)
-            # Bridge-ins are currently handled as withdrawals in the block payload.
-            withdrawals = block.get("withdrawals", None)
-            if withdrawals is not None and len(withdrawals) != 0:
-                l2_deposit_block_num = block_num
+        block_nums = range(start_block, end_block + 1)
+        # The blocks are independent, so fetch them all in a single round trip.
+        blocks = rethrpc.call_batch(
+            [("eth_getBlockByNumber", [hex(block_num), True]) for block_num in block_nums]
+        )
+        # The last block with bridge-ins, so scan from the end and stop at the first one.
+        # Bridge-ins are currently handled as withdrawals in the block payload.
+        l2_deposit_block_num = next(
+            (
+                block_num
+                for block_num, block in zip(reversed(block_nums), reversed(blocks), strict=True)
+                if block.get("withdrawals")
+            ),
+            None,
+        )
         self.info(f"deposit block num on L2: {l2_deposit_block_num}")
 
         # Proving
@@ -127,13 +131,14 @@ class ProverDepositWithdrawTest(bridge_mixin.BridgeMixin):
         l2_withdraw_block_num = withdraw_tx_receipt["blockNumber"]
         self.info(f"withdrawal block num on L2: {l2_withdraw_block_num}")
 
-        last_block_hash = btcrpc.proxy.getblockchaininfo()["bestblockhash"]
-        last_block = btcrpc.proxy.getblock(last_block_hash, 1)
+        last_block_hash = btcrpc.proxy.getbestblockhash()
+        # The headers carry the tx count, no need to fetch the whole blocks.
+        last_block = btcrpc.proxy.getblockheader(last_block_hash)
         # Check all blocks down from the latest.
         # Those blocks will have only coinbase tx for all the empty blocks.
         # Block with the withdrawal transfer will have at least two transactions.
-        while len(last_block["tx"]) <= 1:
-            last_block = btcrpc.proxy.getblock(last_block["previousblockhash"], 1)
+        while last_block["nTx"] <= 1:
+            last_block = btcrpc.proxy.getblockheader(last_block["previousblockhash"])
         l1_withdraw_block_height = last_block["height"]
         self.info(f"withdrawal block height on L1: {l1_withdraw_block_height}")
 
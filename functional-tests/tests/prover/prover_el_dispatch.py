@@ -31,7 +31,7 @@ class ProverClientTest(testenv.StrataTester):
 
         # Wait until at least one EE block is generated.
         wait_until_with_value(
-            lambda: web3.eth.get_block("latest")["number"],
+            lambda: web3.eth.block_number,
             lambda height: height > 0,
             error_with="EE blocks not generated",
         )
@@ -47,7 +47,7 @@ class ProverClientTest(testenv.StrataTester):
 
         # Wait until the end EE block is generated.
         wait_until_with_value(
-            lambda: web3.eth.get_block("latest")["number"],
+            lambda: web3.eth.block_number,
             lambda height: height >= ee_prover_params["end_block"],
             error_with="EE blocks not generated",
         )
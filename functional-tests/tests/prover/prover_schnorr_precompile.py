@@ -25,7 +25,7 @@ class ProverClientTest(testenv.StrataTester):
 
         # Wait for first EE block
         wait_until_with_value(
-            lambda: web3.eth.get_block("latest")["number"],
+            lambda: web3.eth.block_number,
             lambda block_height: block_height > 0,
             error_with="EE blocks not generated",
         )
@@ -46,7 +46,7 @@ class ProverClientTest(testenv.StrataTester):
 
         # Wait for end EE block
         wait_until_with_value(
-            lambda: web3.eth.get_block("latest")["number"],
+            lambda: web3.eth.block_number,
             lambda block_height: block_height >= ee_prover_params["end_block"],
             error_with="EE blocks not generated",
         )
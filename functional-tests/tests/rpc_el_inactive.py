@@ -4,7 +4,7 @@ import flexitest
 from web3 import Web3
 
 from envs import testenv
-from utils import wait_until
+from utils import wait_for_rpc_ready, wait_until
 
 
 @flexitest.register
@@ -23,10 +23,7 @@ class SeqStatusElInactiveTest(testenv.StrataTester):
         # create sequencer RPC and wait until it is active
         seqrpc = seq.create_rpc()
 
-        wait_until(
-            lambda: seqrpc.strata_protocolVersion() is not None,
-            error_with="Sequencer did not start on time",
-        )
+        wait_for_rpc_ready(seqrpc, error_with="Sequencer did not start on time")
 
         # wait for reth to be connected
         web3: Web3 = reth.create_web3()
@@ -3,7 +3,6 @@ import time
 
 import flexitest
 from bitcoinlib.services.bitcoind import BitcoindClient
-from flexitest.service import Service
 
 from envs import net_settings, testenv
 from envs.rollup_params_cfg import RollupConfig
@@ -66,22 +65,20 @@ class BitcoinReorgChecksTest(testenv.StrataTester):
         time.sleep(0.5)
         # Test reorg, without pruning anything, let mempool and wallet retain the txs
         check_nth_checkpoint_finalized_on_reorg(
-            ctx, idx + 1, seq, btcrpc, prover_rpc, self.rollup_settings
+            ctx, idx + 1, seqrpc, seq_addr, btcrpc, prover_rpc, self.rollup_settings
         )
 
 
 def check_nth_checkpoint_finalized_on_reorg(
     ctx: flexitest.RunContext,
     checkpt_idx: int,
-    seq: Service,
+    seqrpc,
+    seq_addr: str,
     btcrpc,
     prover_rpc,
     rollup_settings: RollupParamsSettings,
 ):
     # Now submit another checkpoint proof and produce a couple of blocks(less than reorg depth)
-    seqrpc = seq.create_rpc()
-    seq_addr = seq.get_prop("address")
-
     cfg: RollupConfig = ctx.env.rollup_cfg()
     finality_depth = cfg.l1_reorg_safe_depth
     manual_gen = ManualGenBlocksConfig(btcrpc, finality_depth, seq_addr)
@@ -122,18 +119,16 @@ def check_nth_checkpoint_finalized_on_reorg(
     time.sleep(4)
 
     new_addr = btcrpc.proxy.getnewaddress()
-    # Create a block so that the envelope is included
-    btcrpc.proxy.generatetoaddress(1, new_addr)
-
-    # Create enough blocks to finalize
-    btcrpc.proxy.generatetoaddress(finality_depth + 1, new_addr)
+    # Create a block so that the envelope is included, and enough blocks on top
+    # of it to finalize
+    btcrpc.proxy.generatetoaddress(1 + finality_depth + 1, new_addr)
 
     batch_info = seqrpc.strata_getCheckpointInfo(checkpt_idx)
     to_finalize_blkid = batch_info["l2_range"][1]["blkid"]
 
     # Check finalized
     _ = wait_until_with_value(
-        lambda: seqrpc.strata_syncStatus(),
+        seqrpc.strata_syncStatus,
         lambda v: v["finalized_block_id"] == to_finalize_blkid,
         error_with="Block not finalized",
         timeout=10,
@@ -82,6 +82,6 @@ class SyncFromRpcTest(testenv.StrataTester):
 
         blkid = fn_checkpt_info["l1_reference"]["block_id"]
         blkheight = fn_checkpt_info["l1_reference"]["block_height"]
-        blkdata = btcrpc.proxy.getblock(blkid)
+        blkdata = btcrpc.proxy.getblockheader(blkid)
         assert blkdata["confirmations"] > 0
         assert blkheight > 0
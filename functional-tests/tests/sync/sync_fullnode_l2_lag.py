@@ -24,8 +24,8 @@ class SyncFullNodeL2LagTest(testenv.StrataTester):
         fnrpc = fullnode.create_rpc()
 
         # Wait until sequencer and fullnode start
-        wait_until(seqrpc.strata_protocolVersion, timeout=60)
-        wait_until(fnrpc.strata_protocolVersion, timeout=60)
+        wait_for_rpc_ready(seqrpc, timeout=60)
+        wait_for_rpc_ready(fnrpc, timeout=60)
 
         # Pick a recent slot and make sure they're both the same.
         seqss = seqrpc.strata_syncStatus()
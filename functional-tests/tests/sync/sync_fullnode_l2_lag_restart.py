@@ -23,8 +23,8 @@ class SyncFullNodeL2LagRestartTest(testenv.StrataTester):
         fnrpc = fullnode.create_rpc()
 
         # Wait until sequencer and fullnode start
-        wait_until(seqrpc.strata_protocolVersion, timeout=5)
-        wait_until(fnrpc.strata_protocolVersion, timeout=5)
+        wait_for_rpc_ready(seqrpc, timeout=5)
+        wait_for_rpc_ready(fnrpc, timeout=5)
 
         # Pick a recent slot and make sure they're both the same.
         seqss = seqrpc.strata_syncStatus()
@@ -37,3 +37,11 @@ DEFAULT_TAKEBACK_TIMEOUT = 1008  # Blocks (1 week)
 DEFAULT_PROVER_NATIVE_WORKERS = 20
 DEFAULT_PROVER_POLLING_INTERVAL = 100
 DEFAULT_PROVER_ENABLE_CHECKPOINT_PROVING = False
+
+# EL accounts
+# Prefunded dev account, hardcoded in the test genesis config.
+DEV_ACCOUNT_ADDRESS = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+DEV_ACCOUNT_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+# Account the bridge tests deposit to and withdraw from.
+# NOTE: don't use this private key in production
+BRIDGE_TEST_ETH_PRIVATE_KEY = "0x0000000000000000000000000000000000000000000000000000000000000001"
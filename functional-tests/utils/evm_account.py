@@ -3,6 +3,7 @@ from gevent.lock import Semaphore
 from web3.middleware.signing import SignAndSendRawMiddlewareBuilder
 
 from load.job import StrataLoadJob
+from utils.constants import DEV_ACCOUNT_PRIVATE_KEY
 
 
 class AbstractAccount:
@@ -23,6 +24,11 @@ class AbstractAccount:
     - to avoid races on the nonce when different green threads use the same account.
     """
 
+    _chain_id: int | None = None
+    """
+    Chain id of the node w3 is connected to, fetched once on the first use.
+    """
+
     @property
     def w3(self) -> web3.Web3:
         raise NotImplementedError("w3 should be implemented by subclasses")
@@ -42,6 +48,12 @@ class AbstractAccount:
     def address(self):
         return self.account.address
 
+    @property
+    def chain_id(self) -> int:
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+
     @property
     def balance(self):
         return self.w3.eth.account.get_balance(self.address)
@@ -58,9 +70,7 @@ class GenesisAccount:
     def __init__(self, job: StrataLoadJob):
         w3 = web3.Web3(web3.Web3.HTTPProvider(job.host, session=job.client))
         # Init the prefunded account as specified in the chain config.
-        account = w3.eth.account.from_key(
-            "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
-        )
+        account = w3.eth.account.from_key(DEV_ACCOUNT_PRIVATE_KEY)
         # Set the account onto web3 and init the signing middleware.
         w3.address = account.address
         w3.middleware_onion.add(SignAndSendRawMiddlewareBuilder.build(account))
@@ -1,15 +1,19 @@
+import functools
 import hashlib
 
 from strata_utils import sign_schnorr_sig
 from web3 import Web3
 
+from factory.seqrpc import JsonrpcClient
 from utils import wait_until_with_value
 from utils.constants import PRECOMPILE_SCHNORR_ADDRESS
 
 
+@functools.cache
 def get_precompile_input(secret_key: str, msg: str) -> str:
     """
     Generates the strata schnorr precompile input by signing the SHA-256 hash of the message.
+    Computed once per (secret_key, msg), the tests sign the same constant messages.
 
     Args:
         secret_key (str): The secret key used for signing.
@@ -37,13 +41,8 @@ def make_schnorr_precompile_call(web3: Web3, precompile_input: str) -> tuple[str
         Tuple[str, str]: A tuple containing the transaction hash and result of precompile call.
 
     Raises:
-        ConnectionError: If unable to connect to the blockchain.
         RuntimeError: If the transaction fails.
     """
-    if not web3.is_connected():
-        raise ConnectionError("Cannot connect to reth")
-
-    source = web3.address
     destination = web3.to_checksum_address(PRECOMPILE_SCHNORR_ADDRESS)
 
     # Simulate the precompile call (safe because precompile is stateless)
@@ -54,15 +53,62 @@ def make_schnorr_precompile_call(web3: Web3, precompile_input: str) -> tuple[str
         }
     )
 
+    txid = _send_precompile_transaction(web3, destination, precompile_input)
+    _wait_precompile_transaction(web3, txid)
+
+    return txid, simulated_result.to_0x_hex()
+
+
+def make_schnorr_precompile_calls(
+    web3: Web3, rethrpc: JsonrpcClient, precompile_inputs: list[str]
+) -> list[tuple[str, str]]:
+    """
+    Executes a Schnorr precompile call for each of the inputs.
+    The simulations share a single batch request and the transactions are all sent
+    before waiting for their receipts, so they get mined together.
+
+    Args:
+        web3 (Web3): An instance of Web3.
+        rethrpc (JsonrpcClient): RPC client of the same reth node.
+        precompile_inputs (list[str]): The input data for each of the precompile calls.
+
+    Returns:
+        list[tuple[str, str]]: The transaction hash and result of each precompile call,
+        in the order of `precompile_inputs`.
+
+    Raises:
+        RuntimeError: If any of the transactions fails.
+    """
+    destination = web3.to_checksum_address(PRECOMPILE_SCHNORR_ADDRESS)
+
+    # Simulate the precompile calls (safe because precompile is stateless)
+    simulated_results = rethrpc.call_batch(
+        [
+            ("eth_call", [{"to": destination, "data": "0x" + inp.removeprefix("0x")}, "latest"])
+            for inp in precompile_inputs
+        ]
+    )
+
+    txids = [_send_precompile_transaction(web3, destination, inp) for inp in precompile_inputs]
+    for txid in txids:
+        _wait_precompile_transaction(web3, txid)
+
+    return list(zip(txids, simulated_results, strict=True))
+
+
+def _send_precompile_transaction(web3: Web3, destination: str, precompile_input: str):
     tx_params = {
         "to": destination,
-        "from": source,
+        "from": web3.address,
         "value": hex(0),
         "gas": hex(100000),
         "data": precompile_input,
     }
-    txid = web3.eth.send_transaction(tx_params)
+    return web3.eth.send_transaction(tx_params)
 
+
+def _wait_precompile_transaction(web3: Web3, txid):
+    """Waits for the receipt of the precompile transaction and checks it succeeded."""
     receipt = wait_until_with_value(
         lambda: web3.eth.get_transaction_receipt(txid),
         lambda result: not isinstance(result, Exception),
@@ -72,8 +118,6 @@ def make_schnorr_precompile_call(web3: Web3, precompile_input: str) -> tuple[str
     if receipt.status != 1:
         raise RuntimeError("Precompile transaction failed")
 
-    return txid, simulated_result.to_0x_hex()
-
 
 def get_test_schnnor_secret_key() -> str:
     """Return the test Schnnor secret key."""
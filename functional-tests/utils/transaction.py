@@ -2,10 +2,10 @@ from enum import Enum
 from logging import Logger
 from typing import TypeAlias
 
-import solcx
 import web3
 from eth_typing import HexStr
 from hexbytes import HexBytes
+from web3.contract import Contract
 from web3.types import TxReceipt
 
 from load.reth.log_helper import log_metadata_var, tx_caller
@@ -65,7 +65,7 @@ class TransactionBuilder(_TransactionFaucet):
             )
         elif tx_type == TransactionType.EIP2930:
             tx.setdefault("type", "0x1")
-            tx.setdefault("chainId", self.w3.eth.chain_id)
+            tx.setdefault("chainId", self._acc.chain_id)
             # Define an empty access_list for simplicity for now.
             tx.setdefault("accessList", [{"address": tx["to"], "storageKeys": []}])
 
@@ -75,7 +75,7 @@ class TransactionBuilder(_TransactionFaucet):
 
         elif tx_type == TransactionType.EIP1559:
             tx.setdefault("type", "0x2")
-            tx.setdefault("chainId", self.w3.eth.chain_id)
+            tx.setdefault("chainId", self._acc.chain_id)
 
             # TODO: use from_rpc to fetch the current fee market if needed.
             # Currently hardcoded.
@@ -97,12 +97,23 @@ class TransactionSender(TransactionBuilder):
         gas = tx.get("gasPrice", tx.get("maxFeePerGas"))
         return f"from={tx['from']}, nonce={tx['nonce']}, gas={gas}, gasLimit={tx['gas']}"
 
+    def _sign_and_send(self, tx: Tx) -> HexBytes:
+        """
+        Signs the transaction locally with the account key and submits it
+        via `eth_sendRawTransaction`.
+        """
+        # Legacy transactions don't get the chain id from `fill_tx_fields`,
+        # set it anyways so the signature is replay-protected (EIP-155).
+        tx.setdefault("chainId", self._acc.chain_id)
+        signed = self._acc.account.sign_transaction(tx)
+        return self.w3.eth.send_raw_transaction(signed.raw_transaction)
+
     def send_tx(self, tx: Tx) -> HexStr | None:
         logs_caller = log_metadata_var.get()
         self.log(f"Sending tx=[{logs_caller}]: {self._tx_fmt(tx)}")
 
         try:
-            tx_hash = self.w3.eth.send_transaction(tx)
+            tx_hash = self._sign_and_send(tx)
             hash = self.w3.to_hex(tx_hash)
             self.log(f"Transaction sent with hash={hash}")
 
@@ -116,7 +127,7 @@ class TransactionSender(TransactionBuilder):
         self.log(f"Sending tx=[{logs_caller}] with timeout={timeout}: {self._tx_fmt(tx)}")
 
         try:
-            tx_hash = self.w3.eth.send_transaction(tx)
+            tx_hash = self._sign_and_send(tx)
 
             hash = self.w3.to_hex(tx_hash)
             self.log(f"Transaction sent with hash={hash}")
@@ -172,7 +183,13 @@ class SmartContracts(TransactionSender):
     CONTRACTS_DIR = "contracts/"
     SOL_VERSION = "0.8.7"
 
-    _smart_contracts_storage = dict()
+    _solc_installed: bool = False
+    """Whether `SOL_VERSION` of solc has already been probed/installed in this process."""
+
+    def __init__(self, acc: AbstractAccount, logger=None):
+        super().__init__(acc, logger)
+        # Contracts deployed by this instance, keyed by the contract id.
+        self._contracts: dict[str, Contract] = {}
 
     @staticmethod
     def extract_compiled_contract(compiled_sol, contract_name: str):
@@ -181,13 +198,27 @@ class SmartContracts(TransactionSender):
                 return ct_interface["abi"], ct_interface["bin"]
         return None
 
+    @staticmethod
+    def _ensure_solc():
+        """
+        Imports solcx and installs `SOL_VERSION` of solc on first use, returns the module.
+
+        NOTE: solcx is imported in place since the load jobs import this module on every
+        run, while only the runs that deploy contracts need a compiler.
+        """
+        import solcx
+
+        if not SmartContracts._solc_installed:
+            solcx.install_solc(SmartContracts.SOL_VERSION)
+            SmartContracts._solc_installed = True
+        return solcx
+
     @staticmethod
     def compile_contract(filename, contract_name=None):
         if contract_name is None:
             contract_name = filename.split(".")[0]
 
-        solcx.install_solc(SmartContracts.SOL_VERSION)
-
+        solcx = SmartContracts._ensure_solc()
         compiled_sol = solcx.compile_files(
             [f"{SmartContracts.CONTRACTS_DIR}{filename}"],
             output_values=["abi", "bin"],
@@ -205,23 +236,17 @@ class SmartContracts(TransactionSender):
 
         tx = contract.constructor(*args).build_transaction(tx)
         receipt: TxReceipt = self.send_tx_and_wait(tx)
-        self._smart_contracts_storage[contract_id] = (receipt.contractAddress, abi)
+        self._contracts[contract_id] = self.w3.eth.contract(
+            address=receipt.contractAddress, abi=abi
+        )
         return receipt.contractAddress, abi
 
-    def _contract_abi(self, contract_id):
-        return self._smart_contracts_storage.get(contract_id, (None, None))[1]
-
-    def _contract_address(self, contract_id):
-        return self._smart_contracts_storage.get(contract_id, (None, None))[0]
-
     @tx_caller("CALLING CONTRACT [1]")
     def call_contract(
         self, contract_id, function_name, *args, wait=True
     ) -> HexBytes | TxReceipt | None:
         try:
-            contract = self.w3.eth.contract(
-                address=self._contract_address(contract_id), abi=self._contract_abi(contract_id)
-            )
+            contract = self._contracts[contract_id]
             tx: Tx = TransactionBuilder.new_with_gas(1_000_000)
             self.fill_tx_fields(tx)
 
@@ -235,7 +260,7 @@ class SmartContracts(TransactionSender):
             return None
 
     def get_contract_address(self, contract_id):
-        return self.w3.to_checksum_address(self._contract_address(contract_id))
+        return self._contracts[contract_id].address
 
 
 class ERC20(SmartContracts):
@@ -3,14 +3,16 @@ import math
 import os
 import subprocess
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from threading import Thread
 from typing import Any, Callable, Optional, TypeVar
 
 from bitcoinlib.services.bitcoind import BitcoindClient
 from strata_utils import convert_to_xonly_pk, get_balance, musig_aggregate_pks
+from websockets.exceptions import ConnectionClosed
 
-from factory.seqrpc import JsonrpcClient, RpcError
+from factory.seqrpc import JsonrpcClient, RpcError, Subscription
 from utils.constants import *
 
 
@@ -57,17 +59,46 @@ def generate_n_blocks(bitcoin_rpc: BitcoindClient, n: int):
         return
 
 
+def _poll_delays(
+    timeout: float,
+    step: float,
+    initial: Optional[float],
+    backoff: float,
+    cap: float,
+) -> Iterator[float]:
+    """
+    Yields the delays to sleep for between the polling attempts, until `timeout` runs out.
+    These are a fixed `step`, unless `initial` is given, in which case they start at
+    `initial` and grow by `backoff` times up to `cap`.
+    """
+    if initial is None:
+        for _ in range(math.ceil(timeout / step)):
+            yield step
+        return
+
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while (remaining := deadline - time.monotonic()) > 0:
+        yield min(delay, remaining)
+        delay = min(cap, delay * backoff)
+
+
 def wait_until(
     fn: Callable[[], Any],
     error_with: str = "Timed out",
     timeout: int = 30,
     step: float = 0.5,
+    initial: Optional[float] = None,
+    backoff: float = 2.0,
+    cap: float = 2.0,
 ):
     """
     Wait until a function call returns truth value, given time step, and timeout.
-    This function waits until function call returns truth value at the interval of 1 sec
+    This function waits until function call returns truth value at the interval of `step`.
+    If `initial` is given, the interval starts at it and backs off exponentially instead,
+    so that the fast conditions are noticed early and the slow ones aren't polled as often.
     """
-    for _ in range(math.ceil(timeout / step)):
+    for delay in _poll_delays(timeout, step, initial, backoff, cap):
         try:
             # Return if the predicate passes.  The predicate not passing is not
             # an error.
@@ -76,7 +107,7 @@ def wait_until(
         except Exception as e:
             ety = type(e)
             logging.warning(f"caught exception {ety}, will still wait for timeout: {e}")
-        time.sleep(step)
+        time.sleep(delay)
     raise AssertionError(error_with)
 
 
@@ -90,12 +121,15 @@ def wait_until_with_value(
     timeout: int = 5,
     step: float = 0.5,
     debug=False,
+    initial: Optional[float] = None,
+    backoff: float = 2.0,
+    cap: float = 2.0,
 ) -> T:
     """
     Similar to `wait_until` but this returns the value of the function.
     This also takes another predicate which acts on the function value and returns a bool
     """
-    for _ in range(math.ceil(timeout / step)):
+    for delay in _poll_delays(timeout, step, initial, backoff, cap):
         try:
             r = fn()
             # Return if the predicate passes.  The predicate not passing is not
@@ -108,10 +142,96 @@ def wait_until_with_value(
             ety = type(e)
             logging.warning(f"caught exception {ety}, will still wait for timeout: {e}")
 
-        time.sleep(step)
+        time.sleep(delay)
     raise AssertionError(error_with)
 
 
+def wait_for_rpc_ready(
+    rpc: JsonrpcClient,
+    method: str = "strata_protocolVersion",
+    error_with: str = "RPC did not come up on time",
+    timeout: int = 30,
+    initial: float = 0.05,
+    backoff: float = 1.5,
+    cap: float = 1.0,
+):
+    """
+    Waits until the no-params RPC `method` returns a non-null result and returns it.
+    Polls with a backoff, so that a service which is (nearly) up already doesn't cost
+    us a whole fixed step.
+    """
+    return wait_until_with_value(
+        getattr(rpc, method),
+        lambda r: r is not None,
+        error_with=error_with,
+        timeout=timeout,
+        initial=initial,
+        backoff=backoff,
+        cap=cap,
+    )
+
+
+def wait_until_el_block(
+    rethrpc: JsonrpcClient,
+    block_no: int,
+    error_with: str = "EL block not produced on time",
+    timeout: float = 30,
+    heads: Optional[Subscription] = None,
+) -> int:
+    """
+    Waits until the EL chain reaches block `block_no` and returns its tip block number.
+
+    The new heads are pushed to us by a `newHeads` subscription, so each block is noticed
+    as soon as it's produced. Callers waiting block by block should open one with
+    `rethrpc.subscribe("newHeads")` and pass it as `heads` to reuse it across waits.
+    Without one, a wait for the next block (or non-websocket endpoint) is polled, and
+    longer waits open a subscription of their own.
+    """
+    if heads is not None:
+        return _wait_for_el_head(rethrpc, heads, block_no, error_with, timeout)
+
+    tip = int(rethrpc.eth_blockNumber(), 16)
+    if block_no - tip <= 1 or not rethrpc.url.startswith("ws"):
+        return wait_until_with_value(
+            lambda: int(rethrpc.eth_blockNumber(), 16),
+            lambda n: n >= block_no,
+            error_with=error_with,
+            timeout=timeout,
+            step=0.2,
+        )
+
+    with rethrpc.subscribe("newHeads") as heads:
+        return _wait_for_el_head(rethrpc, heads, block_no, error_with, timeout)
+
+
+def _wait_for_el_head(
+    rethrpc: JsonrpcClient,
+    heads: Subscription,
+    block_no: int,
+    error_with: str,
+    timeout: float,
+) -> int:
+    end = time.monotonic() + timeout
+
+    # Read after subscribing, so a block produced in between isn't missed. Heads that
+    # queued up on a reused subscription are older than the tip and just get skipped.
+    tip = int(rethrpc.eth_blockNumber(), 16)
+    while tip < block_no:
+        try:
+            tip = int(heads.next(timeout=max(0.0, end - time.monotonic()))["number"], 16)
+        except TimeoutError:
+            raise AssertionError(error_with) from None
+    return tip
+
+
+def wait_until_stopped(svc, error_with: str = "Service did not stop on time", timeout=2, step=0.05):
+    """
+    Waits until the process of a stopped service has actually exited, which might take
+    a moment after `stop()` returns.
+    """
+    wait_until(lambda: not svc.check_status(), error_with=error_with, timeout=timeout, step=step)
+
+
 def wait_for_genesis(rpc, timeout=20, step=2, **kwargs):
     """
     Waits until we see genesis.  That is to say, that `strata_syncStatus`
@@ -149,7 +269,7 @@ def wait_until_chain_epoch(rpc, epoch: int, **kwargs) -> dict:
 
     def _query():
         status = rpc.strata_syncStatus()
-        logging.debug(f"checked status {status}")
+        logging.debug("checked status %s", status)
         commitments = rpc.strata_getEpochCommitments(epoch)
         if len(commitments) > 0:
             comm = commitments[0]
@@ -272,8 +392,7 @@ def wait_until_cur_l1_tip_observed(btcrpc, seqrpc, **kwargs):
 
     Returns the L1 block height.
     """
-    info = btcrpc.proxy.getblockchaininfo()
-    h = info["blocks"]
+    h = btcrpc.proxy.getblockcount()
     logging.info(f"current bitcoin height is {h}")
     wait_until_l1_observed(seqrpc, h, **kwargs)
 
@@ -365,14 +484,14 @@ def check_nth_checkpoint_finalized(
     def _maybe_do_gen():
         if manual_gen:
             nblocks = manual_gen.finality_depth + 1
-            logging.debug(f"generating {nblocks} L1 blocks to try to finalize")
+            logging.debug("generating %d L1 blocks to try to finalize", nblocks)
             manual_gen.btcrpc.proxy.generatetoaddress(nblocks, manual_gen.gen_addr)
 
     def _check():
-        cs = seqrpc.strata_clientStatus()
+        # Both statuses in one round trip, this is polled for up to minutes.
+        cs, ss = seqrpc.call_batch([("strata_clientStatus", []), ("strata_syncStatus", [])])
         l1_height = cs["tip_l1_block"]["height"]
         fin_epoch = cs["finalized_epoch"]
-        ss = seqrpc.strata_syncStatus()
         cur_epoch = ss["cur_epoch"]
         chain_l1_height = ss["safe_l1_block"]["height"]
         logging.info(
@@ -745,6 +864,25 @@ def get_envelope_pushdata(inp: str):
     return op_if_block[pushdata_position + 2 + 4 :]
 
 
+def find_envelope_pushdata(btcrpc: BitcoindClient, blockhash: str) -> str:
+    """
+    Returns the DA envelope pushdata of the first envelope transaction in the L1 block.
+    Raises `ValueError` if there is none.
+    """
+    # Take the witnesses straight from bitcoind's JSON (verbosity 2 has them as hex),
+    # parsing every transaction of the block with bitcoinlib is way more expensive.
+    block_data = btcrpc.proxy.getblock(blockhash, 2)
+    for tx in block_data["tx"]:
+        for txin in tx["vin"]:
+            # The envelope is in the tapscript, one of the witness items.
+            for item in txin.get("txinwitness", ()):
+                try:
+                    return get_envelope_pushdata(item)
+                except ValueError:
+                    continue
+    raise ValueError(f"Could not find envelope transaction in L1 block {blockhash}")
+
+
 def submit_da_blob(btcrpc: BitcoindClient, seqrpc: JsonrpcClient, blobdata: str):
     _ = seqrpc.strataadmin_submitDABlob(blobdata)
 
@@ -779,9 +917,12 @@ def check_sequencer_down(seqrpc):
     Returns True if sequencer RPC is down
     """
     try:
+        # The cheapest call there is, takes no params and returns a number.
         seqrpc.strata_protocolVersion()
         return False
-    except RuntimeError:
+    except (RuntimeError, OSError, ConnectionClosed):
+        # RuntimeError is raised by the status pre-check when the process is down,
+        # the others when the connection is refused or dropped by the server.
         return True
 
 
@@ -801,13 +942,13 @@ def confirm_btc_withdrawal(
     # Wait for the new balance,
     # this includes waiting for a new batch checkpoint,
     # duty processing by the bridge clients and maturity of the withdrawal.
-    wait_until(
-        lambda: get_balance(withdraw_address, btc_url, btc_user, btc_password) > original_balance,
+    btc_balance = wait_until_with_value(
+        lambda: get_balance(withdraw_address, btc_url, btc_user, btc_password),
+        predicate=lambda balance: balance > original_balance,
         timeout=60,
     )
 
     # Check final BTC balance
-    btc_balance = get_balance(withdraw_address, btc_url, btc_user, btc_password)
     debug_fn(f"BTC final balance: {btc_balance}")
     debug_fn(f"Expected final balance: {original_balance + expected_increase}")
 
@@ -816,8 +957,15 @@ def confirm_btc_withdrawal(
     )
 
 
+def eth_balance_wei(rethrpc, address: str) -> int:
+    """Returns the latest EL balance of `address` in wei, the `0x` prefix is optional."""
+    if not address.startswith("0x"):
+        address = f"0x{address}"
+    return int(rethrpc.eth_getBalance(address), 16)
+
+
 def check_initial_eth_balance(rethrpc, address, debug_fn=print):
     """Asserts that the initial ETH balance for `address` is zero."""
-    balance = int(rethrpc.eth_getBalance(address), 16)
+    balance = eth_balance_wei(rethrpc, address)
     debug_fn(f"Strata Balance before deposits: {balance}")
     assert balance == 0, "Strata balance is not expected (should be zero initially)"